@@ -7,9 +7,10 @@ import os
 import logging
 from flask import Flask
 
-from .config import settings, get_logging_config, get_cache_config
+from .config import settings, get_cache_config
 from .routes import main_bp, api_bp, quantum_bp
 from .utils.cache import initialize_cache
+from .utils.json_provider import NumpyJSONProvider
 
 # Configure simple logging for application startup
 logging.basicConfig(
@@ -43,6 +44,9 @@ def create_app():
         'TESTING': settings.environment.name == 'TESTING'
     })
     
+    # Serialize NumPy arrays directly in JSON responses
+    app.json = NumpyJSONProvider(app)
+    
     # Initialize cache system
     try:
         cache_config = get_cache_config()
@@ -102,6 +102,16 @@ class Settings(BaseSettings):
     # Redis/Cache Settings
     redis_url: Optional[str] = Field(default=None, description="Redis connection URL")
     cache_backend: str = Field(default="memory", description="Cache backend type")
+    redis_pool_size: int = Field(default=32, description="Maximum Redis connections per worker")
+    redis_socket_timeout: float = Field(default=2.0, description="Redis socket timeout in seconds")
+    cache_l1_size: int = Field(
+        default=0,
+        description="Per-worker in-memory entries kept in front of Redis (0 disables the L1 tier)"
+    )
+    cache_background_writes: bool = Field(
+        default=False,
+        description="Write cache entries to Redis from a background thread instead of inline"
+    )
     
     # Monitoring Settings
     enable_metrics: bool = Field(default=False, description="Enable Prometheus metrics")
@@ -241,7 +251,11 @@ def get_cache_config() -> dict:
         return {
             "backend": "redis",
             "url": settings.redis_url,
-            "ttl": settings.cache_ttl
+            "ttl": settings.cache_ttl,
+            "pool_size": settings.redis_pool_size,
+            "socket_timeout": settings.redis_socket_timeout,
+            "l1_size": settings.cache_l1_size,
+            "background_writes": settings.cache_background_writes
         }
     else:
         return {
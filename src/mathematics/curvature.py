@@ -4,55 +4,78 @@ Provides functions for calculating various types of curvature.
 """
 
 import numpy as np
-from typing import Tuple
+from typing import NamedTuple, Optional, Tuple
 
 from ..config import settings
 
+# Surface grids are laid out as (..., v, u): u varies fastest, so u-gradients
+# run along the trailing, contiguous axis of C-ordered arrays
+U_AXIS = -1
+V_AXIS = -2
 
-def calculate_gaussian_curvature(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+
+class SurfaceDerivatives(NamedTuple):
+    """First and second finite-difference derivatives of a surface.
+    
+    Each field is a stacked (3, rows, cols) array of the x, y, z components,
+    so it can be unpacked as ``dx, dy, dz = derivatives.du``.
     """
-    Calculate approximate Gaussian curvature for surface quality assessment.
+    du: np.ndarray
+    dv: np.ndarray
+    duu: np.ndarray
+    dvv: np.ndarray
+    duv: np.ndarray
+
+
+def calculate_surface_derivatives(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> SurfaceDerivatives:
+    """
+    Calculate the surface derivatives shared by curvature and quality metrics.
+    
+    The coordinates are stacked so each derivative is taken for all three
+    components in a single np.gradient pass.
     
     Args:
         x, y, z: Surface coordinate arrays
         
     Returns:
-        Array of curvature values
+        SurfaceDerivatives with first, second and mixed derivatives
     """
-    stability_threshold = settings.stability_threshold
+    points = np.stack((x, y, z))
     
     # First derivatives
-    dx_du = np.gradient(x, axis=1)
-    dy_du = np.gradient(y, axis=1)
-    dz_du = np.gradient(z, axis=1)
-    
-    dx_dv = np.gradient(x, axis=0)
-    dy_dv = np.gradient(y, axis=0)
-    dz_dv = np.gradient(z, axis=0)
+    dv, du = np.gradient(points, axis=(V_AXIS, U_AXIS))
     
     # Second derivatives
-    d2x_du2 = np.gradient(dx_du, axis=1)
-    d2y_du2 = np.gradient(dy_du, axis=1)
-    d2z_du2 = np.gradient(dz_du, axis=1)
+    duv, duu = np.gradient(du, axis=(V_AXIS, U_AXIS))
+    dvv = np.gradient(dv, axis=V_AXIS)
     
-    d2x_dv2 = np.gradient(dx_dv, axis=0)
-    d2y_dv2 = np.gradient(dy_dv, axis=0)
-    d2z_dv2 = np.gradient(dz_dv, axis=0)
-    
-    d2x_dudv = np.gradient(dx_du, axis=0)
-    d2y_dudv = np.gradient(dy_du, axis=0)
-    d2z_dudv = np.gradient(dz_du, axis=0)
+    return SurfaceDerivatives(du, dv, duu, dvv, duv)
+
+
+def _fundamental_forms(derivatives: SurfaceDerivatives) -> Tuple[np.ndarray, ...]:
+    """Compute first (E, F, G) and second (L, M, N) fundamental form coefficients."""
+    dx_du, dy_du, dz_du = derivatives.du
+    dx_dv, dy_dv, dz_dv = derivatives.dv
+    d2x_du2, d2y_du2, d2z_du2 = derivatives.duu
+    d2x_dv2, d2y_dv2, d2z_dv2 = derivatives.dvv
+    d2x_dudv, d2y_dudv, d2z_dudv = derivatives.duv
     
     # Normal vector
     nx = dy_du * dz_dv - dz_du * dy_dv
     ny = dz_du * dx_dv - dx_du * dz_dv
     nz = dx_du * dy_dv - dy_du * dx_dv
     
-    # Normalize
-    norm = np.sqrt(nx**2 + ny**2 + nz**2) + 1e-10
-    nx, ny, nz = nx/norm, ny/norm, nz/norm
-    
-    # Calculate mean curvature components
+    # Normalize in place; nx/ny/nz are fresh arrays owned by this function
+    norm = nx * nx
+    norm += ny * ny
+    norm += nz * nz
+    np.sqrt(norm, out=norm)
+    norm += 1e-10
+    np.divide(nx, norm, out=nx)
+    np.divide(ny, norm, out=ny)
+    np.divide(nz, norm, out=nz)
+    
+    # Second fundamental form coefficients
     L = d2x_du2 * nx + d2y_du2 * ny + d2z_du2 * nz
     M = d2x_dudv * nx + d2y_dudv * ny + d2z_dudv * nz
     N = d2x_dv2 * nx + d2y_dv2 * ny + d2z_dv2 * nz
@@ -62,6 +85,27 @@ def calculate_gaussian_curvature(x: np.ndarray, y: np.ndarray, z: np.ndarray) ->
     F = dx_du * dx_dv + dy_du * dy_dv + dz_du * dz_dv
     G = dx_dv**2 + dy_dv**2 + dz_dv**2
     
+    return E, F, G, L, M, N
+
+
+def calculate_gaussian_curvature(x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                                 derivatives: Optional[SurfaceDerivatives] = None) -> np.ndarray:
+    """
+    Calculate approximate Gaussian curvature for surface quality assessment.
+    
+    Args:
+        x, y, z: Surface coordinate arrays
+        derivatives: Precomputed surface derivatives, if available
+        
+    Returns:
+        Array of curvature values
+    """
+    stability_threshold = settings.stability_threshold
+    
+    if derivatives is None:
+        derivatives = calculate_surface_derivatives(x, y, z)
+    E, F, G, L, M, N = _fundamental_forms(derivatives)
+    
     # Gaussian curvature
     det_I = E * G - F**2
     gaussian_curvature = np.where(
@@ -73,58 +117,23 @@ def calculate_gaussian_curvature(x: np.ndarray, y: np.ndarray, z: np.ndarray) ->
     return gaussian_curvature
 
 
-def calculate_mean_curvature(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+def calculate_mean_curvature(x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                             derivatives: Optional[SurfaceDerivatives] = None) -> np.ndarray:
     """
     Calculate mean curvature for a parametric surface.
     
     Args:
         x, y, z: Surface coordinate arrays
+        derivatives: Precomputed surface derivatives, if available
         
     Returns:
         Array of mean curvature values
     """
     stability_threshold = settings.stability_threshold
     
-    # First derivatives
-    dx_du = np.gradient(x, axis=1)
-    dy_du = np.gradient(y, axis=1)
-    dz_du = np.gradient(z, axis=1)
-    
-    dx_dv = np.gradient(x, axis=0)
-    dy_dv = np.gradient(y, axis=0)
-    dz_dv = np.gradient(z, axis=0)
-    
-    # Second derivatives
-    d2x_du2 = np.gradient(dx_du, axis=1)
-    d2y_du2 = np.gradient(dy_du, axis=1)
-    d2z_du2 = np.gradient(dz_du, axis=1)
-    
-    d2x_dv2 = np.gradient(dx_dv, axis=0)
-    d2y_dv2 = np.gradient(dy_dv, axis=0)
-    d2z_dv2 = np.gradient(dz_dv, axis=0)
-    
-    d2x_dudv = np.gradient(dx_du, axis=0)
-    d2y_dudv = np.gradient(dy_du, axis=0)
-    d2z_dudv = np.gradient(dz_du, axis=0)
-    
-    # Normal vector
-    nx = dy_du * dz_dv - dz_du * dy_dv
-    ny = dz_du * dx_dv - dx_du * dz_dv
-    nz = dx_du * dy_dv - dy_du * dx_dv
-    
-    # Normalize
-    norm = np.sqrt(nx**2 + ny**2 + nz**2) + 1e-10
-    nx, ny, nz = nx/norm, ny/norm, nz/norm
-    
-    # Calculate mean curvature components
-    L = d2x_du2 * nx + d2y_du2 * ny + d2z_du2 * nz
-    M = d2x_dudv * nx + d2y_dudv * ny + d2z_dudv * nz
-    N = d2x_dv2 * nx + d2y_dv2 * ny + d2z_dv2 * nz
-    
-    # First fundamental form coefficients
-    E = dx_du**2 + dy_du**2 + dz_du**2
-    F = dx_du * dx_dv + dy_du * dy_dv + dz_du * dz_dv
-    G = dx_dv**2 + dy_dv**2 + dz_dv**2
+    if derivatives is None:
+        derivatives = calculate_surface_derivatives(x, y, z)
+    E, F, G, L, M, N = _fundamental_forms(derivatives)
     
     # Mean curvature
     det_I = E * G - F**2
@@ -147,9 +156,10 @@ def calculate_principal_curvatures(x: np.ndarray, y: np.ndarray, z: np.ndarray)
     Returns:
         Tuple of (k1, k2) principal curvature arrays
     """
-    # Calculate Gaussian and mean curvatures
-    K = calculate_gaussian_curvature(x, y, z)
-    H = calculate_mean_curvature(x, y, z)
+    # Calculate Gaussian and mean curvatures from one derivative pass
+    derivatives = calculate_surface_derivatives(x, y, z)
+    K = calculate_gaussian_curvature(x, y, z, derivatives)
+    H = calculate_mean_curvature(x, y, z, derivatives)
     
     # Principal curvatures from Gaussian and mean curvatures
     # k1, k2 = H ± sqrt(H² - K)
@@ -165,6 +175,8 @@ def calculate_principal_curvatures(x: np.ndarray, y: np.ndarray, z: np.ndarray)
 
 # Export public interface
 __all__ = [
+    "SurfaceDerivatives",
+    "calculate_surface_derivatives",
     "calculate_gaussian_curvature",
     "calculate_mean_curvature", 
     "calculate_principal_curvatures"
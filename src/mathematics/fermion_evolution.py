@@ -5,8 +5,10 @@ in the SKB (Spacetime Klein Bottle) hypothesis.
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Mapping, Tuple, Optional
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 import math
 
 # Physical constants (in natural units where c = ℏ = 1)
@@ -14,8 +16,54 @@ PLANCK_CONSTANT = 1.0  # ℏ
 SPEED_OF_LIGHT = 1.0   # c
 ELECTRON_CHARGE = 1.0  # e (elementary charge unit)
 
+# Radius of the helical CTC path
+CTC_RADIUS = 1.5
 
-@dataclass
+# Coordinate arrays are only rendered, so single precision is sufficient
+_COORD_DTYPE = np.float32
+
+
+@lru_cache(maxsize=8)
+def _ctc_base(resolution: int) -> Tuple[np.ndarray, ...]:
+    """
+    Phase-independent tables for the CTC path at a given resolution.
+    
+    Args:
+        resolution: Number of points on the curve
+        
+    Returns:
+        Read-only arrays (t, r·cos t, r·sin t, 0.5·sin 2t, 0.5·cos 2t)
+    """
+    t = np.linspace(0, 2*math.pi, resolution)
+    tables = tuple(
+        table.astype(_COORD_DTYPE) for table in (
+            t,
+            CTC_RADIUS * np.cos(t),
+            CTC_RADIUS * np.sin(t),
+            0.5 * np.sin(2*t),
+            0.5 * np.cos(2*t),
+        )
+    )
+    for table in tables:
+        table.flags.writeable = False
+    return tables
+
+
+@lru_cache(maxsize=256)
+def _quantized_action(mass: float, period: float) -> float:
+    """Quantized CTC action for a given mass and period."""
+    # For a circular CTC: ∮ p_μ dx^μ = ET where E = mc²
+    energy = mass * SPEED_OF_LIGHT**2
+    action = energy * period
+    
+    # Ensure quantization: action = 2πnℏ
+    n = round(action / (2 * math.pi * PLANCK_CONSTANT))
+    quantized_action = 2 * math.pi * n * PLANCK_CONSTANT
+    
+    return quantized_action
+
+
+@dataclass(slots=True, frozen=True)
 class FermionProperties:
     """Properties of a fermion in the SKB framework."""
     name: str
@@ -28,6 +76,73 @@ class FermionProperties:
     stiefel_whitney_class: int = 1  # for fermions
 
 
+# Standard fermion properties from the paper
+_STANDARD_FERMIONS = MappingProxyType({
+    'up': FermionProperties(
+        name='Up Quark',
+        mass=2.3,  # MeV/c²
+        charge=2/3,
+        twist_angle=2*math.pi/3 + 0.10,
+        period=1.2,
+        color='#ff4444'
+    ),
+    'down': FermionProperties(
+        name='Down Quark',
+        mass=4.8,  # MeV/c²
+        charge=-1/3,
+        twist_angle=4*math.pi/3 - 0.20,
+        period=0.9,
+        color='#4444ff'
+    ),
+    'electron': FermionProperties(
+        name='Electron',
+        mass=0.511,  # MeV/c²
+        charge=-1,
+        twist_angle=math.pi,
+        period=2.1,
+        color='#44ff44'
+    ),
+    'muon': FermionProperties(
+        name='Muon',
+        mass=105.7,  # MeV/c²
+        charge=-1,
+        twist_angle=math.pi + 0.3,
+        period=0.3,
+        color='#ff44ff'
+    ),
+    'neutrino': FermionProperties(
+        name='Neutrino',
+        mass=0.001,  # MeV/c²
+        charge=0,
+        twist_angle=math.pi/2,
+        period=10.0,
+        color='#ffff44'
+    )
+})
+
+
+def _build_standard_soa() -> Mapping[str, np.ndarray]:
+    """Build a read-only structure-of-arrays view of the standard fermions.
+    
+    Row order follows the insertion order of _STANDARD_FERMIONS.
+    """
+    props = list(_STANDARD_FERMIONS.values())
+    soa = {
+        'mass': np.array([p.mass for p in props]),
+        'charge': np.array([p.charge for p in props]),
+        'twist_angle': np.array([p.twist_angle for p in props]),
+        'period': np.array([p.period for p in props]),
+        'is_quark': np.array(['quark' in p.name.lower() for p in props])
+    }
+    for array in soa.values():
+        array.flags.writeable = False
+    return MappingProxyType(soa)
+
+
+# Structure-of-arrays view for vectorized multi-fermion calculations
+_STANDARD_SOA = _build_standard_soa()
+
+
 class FermionSKB:
     """
     Spacetime Klein Bottle representation of a fermion.
@@ -41,7 +156,9 @@ class FermionSKB:
         self.charge = properties.charge
         self.period = properties.period
         
-    def calculate_mass_from_ctc_period(self, period: float, winding_number: int = 1) -> float:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def calculate_mass_from_ctc_period(period: float, winding_number: int = 1) -> float:
         """
         Calculate mass from CTC period using the relation: m = 2πnℏ/(c²T)
         
@@ -72,15 +189,7 @@ class FermionSKB:
         Returns:
             Action integral ∮ p_μ dx^μ
         """
-        # For a circular CTC: ∮ p_μ dx^μ = ET where E = mc²
-        energy = self.mass * SPEED_OF_LIGHT**2
-        action = energy * self.period
-        
-        # Ensure quantization: action = 2πnℏ
-        n = round(action / (2 * math.pi * PLANCK_CONSTANT))
-        quantized_action = 2 * math.pi * n * PLANCK_CONSTANT
-        
-        return quantized_action
+        return _quantized_action(self.mass, self.period)
     
     def generate_klein_bottle_coordinates(self, 
                                         u_range: Tuple[float, float] = (0, 2*math.pi),
@@ -99,9 +208,9 @@ class FermionSKB:
         Returns:
             Dictionary with x, y, z coordinates and metadata
         """
-        u = np.linspace(u_range[0], u_range[1], resolution)
-        v = np.linspace(v_range[0], v_range[1], resolution)
-        U, V = np.meshgrid(u, v)
+        # Row/column parameter vectors; the grid is formed by broadcasting
+        U = np.linspace(u_range[0], u_range[1], resolution, dtype=_COORD_DTYPE)[np.newaxis, :]
+        V = np.linspace(v_range[0], v_range[1], resolution, dtype=_COORD_DTYPE)[:, np.newaxis]
         
         # Klein bottle parameterization with twist and time evolution
         theta = self.twist_angle
@@ -111,21 +220,30 @@ class FermionSKB:
         # With CTC time dependence and twist angle
         
         # Temporal modulation from CTC
-        temporal_factor = 1 + 0.1 * np.sin(t_phase)
+        temporal_factor = 1 + 0.1 * math.sin(t_phase)
+        
+        # Klein bottle surface equations with twist; the half-angle and
+        # V-dependent factors are 1D, so each grid term is a single pass
+        cos_half_u, sin_half_u = np.cos(U/2), np.sin(U/2)
+        cos_v, sin_v = np.cos(V), np.sin(V)
         
-        # Klein bottle surface equations with twist
-        r = 2 + np.cos(U/2) * np.sin(V) - np.sin(U/2) * np.sin(2*V)
+        r = cos_half_u * sin_v
+        r -= sin_half_u * np.sin(2*V)
+        r += 2
         r *= temporal_factor
         
-        # Spatial coordinates
-        x_base = r * np.cos(V)
-        y_base = r * np.sin(V) 
-        z_base = np.cos(U/2) * np.cos(V) + np.sin(U/2) * np.cos(2*V)
+        z_base = cos_half_u * cos_v
+        z_base += sin_half_u * np.cos(2*V)
         
-        # Apply twist rotation around z-axis
-        x = x_base * np.cos(theta) - z_base * np.sin(theta)
-        y = y_base
-        z = x_base * np.sin(theta) + z_base * np.cos(theta)
+        # Spatial coordinates with the twist rotation around the z-axis
+        # applied to the 1D factors: x = x_base*cos(θ) - z_base*sin(θ), etc.
+        cos_theta, sin_theta = math.cos(theta), math.sin(theta)
+        x = r * (cos_v * cos_theta)
+        x -= z_base * sin_theta
+        y = r * sin_v
+        z = r * (cos_v * sin_theta)
+        z_base *= cos_theta
+        z += z_base
         
         # Calculate curvature and charge density
         gaussian_curvature = self._calculate_gaussian_curvature(U, V)
@@ -135,8 +253,8 @@ class FermionSKB:
             'x': x,
             'y': y, 
             'z': z,
-            'u': U,
-            'v': V,
+            'u': np.broadcast_to(U, x.shape),
+            'v': np.broadcast_to(V, x.shape),
             'curvature': gaussian_curvature,
             'charge_density': charge_density,
             'temporal_factor': temporal_factor
@@ -145,7 +263,8 @@ class FermionSKB:
     def _calculate_gaussian_curvature(self, U: np.ndarray, V: np.ndarray) -> np.ndarray:
         """Calculate Gaussian curvature of the Klein bottle surface."""
         # Simplified curvature calculation
-        K = np.abs(np.sin(U) * np.cos(V)) + 0.1 * np.abs(np.cos(U/2))
+        K = np.abs(np.sin(U)) * np.abs(np.cos(V))
+        K += 0.1 * np.abs(np.cos(U/2))
         return K
     
     def generate_ctc_path(self, time: float, resolution: int = 100) -> Dict[str, np.ndarray]:
@@ -159,18 +278,21 @@ class FermionSKB:
         Returns:
             Dictionary with CTC path coordinates
         """
-        t = np.linspace(0, 2*math.pi, resolution)
+        t, rcos, rsin, zsin, zcos = _ctc_base(resolution)
         phase = time * 2 * math.pi / self.period
+        cos_p, sin_p = math.cos(phase), math.sin(phase)
         
-        # CTC parameterization - helical path in spacetime
-        radius = 1.5
-        
-        x = radius * np.cos(t + phase)
-        y = radius * np.sin(t + phase)
-        z = 0.5 * np.sin(2*t + phase)
+        # CTC parameterization - helical path in spacetime, shifted by the
+        # phase via the angle-addition formulas on the cached tables
+        x = np.multiply(rcos, cos_p)
+        x -= rsin * sin_p
+        y = np.multiply(rsin, cos_p)
+        y += rcos * sin_p
+        z = np.multiply(zsin, cos_p)
+        z += zcos * sin_p
         
         # Add proper time component (4th dimension projected)
-        proper_time = t / (2*math.pi) * self.period
+        proper_time = t * (self.period / (2*math.pi))
         
         return {
             'x': x,
@@ -198,28 +320,27 @@ class FermionSKB:
         if abs(self.charge) < 1e-6:
             return []  # No field lines for neutral particles
         
-        field_lines = []
-        
-        for i in range(num_lines):
-            angle = (i / num_lines) * 2 * math.pi
-            
-            # Radial field line from origin
-            r = np.linspace(0.5, max_radius, 50)
-            
-            x = r * np.cos(angle)
-            y = r * np.sin(angle)
-            z = 0.2 * np.sin(r * 2)  # Slight z-modulation
-            
-            # Field strength (Coulomb-like)
-            field_strength = abs(self.charge) / (r**2 + 0.1)  # Regularized
-            
-            field_lines.append({
-                'x': x,
-                'y': y,
-                'z': z,
-                'field_strength': field_strength,
-                'charge_sign': np.sign(self.charge)
-            })
+        # All lines share the radial profile; compute them as one
+        # (num_lines, 50) batch via outer products
+        r = np.linspace(0.5, max_radius, 50)
+        angles = np.arange(num_lines) * (2 * math.pi / num_lines)
+        
+        X = np.outer(np.cos(angles), r)
+        Y = np.outer(np.sin(angles), r)
+        Z = np.broadcast_to(0.2 * np.sin(r * 2), X.shape)  # Slight z-modulation
+        F = np.broadcast_to(abs(self.charge) / (r**2 + 0.1), X.shape)  # Coulomb-like, regularized
+        charge_sign = np.sign(self.charge)
+        
+        field_lines = [
+            {
+                'x': X[i],
+                'y': Y[i],
+                'z': Z[i].copy(),
+                'field_strength': F[i].copy(),
+                'charge_sign': charge_sign
+            }
+            for i in range(num_lines)
+        ]
         
         return field_lines
     
@@ -264,13 +385,30 @@ class FermionSKB:
             target_fermion: Target fermion after decay
             time: Time parameter
             
+        Returns:
+            Transition data including matrix elements and probabilities
+        """
+        return self._beta_decay_transition_props(self.properties, target_fermion.properties, time)
+    
+    @staticmethod
+    def _beta_decay_transition_props(initial: FermionProperties,
+                                     target: FermionProperties,
+                                     time: float) -> Dict[str, float]:
+        """
+        Beta decay transition computed directly from fermion properties.
+        
+        Args:
+            initial: Properties of the decaying fermion
+            target: Properties of the fermion after decay
+            time: Time parameter
+            
         Returns:
             Transition data including matrix elements and probabilities
         """
         # Transition matrix element for d → u + W⁻
         # Based on topological transition of Klein bottle structure
         
-        theta_diff = abs(self.twist_angle - target_fermion.twist_angle)
+        theta_diff = abs(initial.twist_angle - target.twist_angle)
         
         # Weak interaction coupling (from paper)
         g_w = 0.63  # Weak coupling constant
@@ -283,7 +421,7 @@ class FermionSKB:
         matrix_element = g_w * np.sin(theta_w/2) / np.sqrt(2*math.pi) * V_ud
         
         # Phase space factor (3-body decay: n → p + e⁻ + ν̄)
-        Q = abs(self.mass - target_fermion.mass)  # Energy release
+        Q = abs(initial.mass - target.mass)  # Energy release
         if Q > 0:
             phase_space = Q**5 / (5760 * math.pi**3)  # 3-body phase space
         else:
@@ -311,56 +449,20 @@ class FermionEvolutionSystem:
     def __init__(self):
         self.fermions: List[FermionSKB] = []
         
-        # Standard fermion properties from the paper
-        self.standard_fermions = {
-            'up': FermionProperties(
-                name='Up Quark',
-                mass=2.3,  # MeV/c²
-                charge=2/3,
-                twist_angle=2*math.pi/3 + 0.10,
-                period=1.2,
-                color='#ff4444'
-            ),
-            'down': FermionProperties(
-                name='Down Quark',
-                mass=4.8,  # MeV/c²
-                charge=-1/3,
-                twist_angle=4*math.pi/3 - 0.20,
-                period=0.9,
-                color='#4444ff'
-            ),
-            'electron': FermionProperties(
-                name='Electron',
-                mass=0.511,  # MeV/c²
-                charge=-1,
-                twist_angle=math.pi,
-                period=2.1,
-                color='#44ff44'
-            ),
-            'muon': FermionProperties(
-                name='Muon',
-                mass=105.7,  # MeV/c²
-                charge=-1,
-                twist_angle=math.pi + 0.3,
-                period=0.3,
-                color='#ff44ff'
-            ),
-            'neutrino': FermionProperties(
-                name='Neutrino',
-                mass=0.001,  # MeV/c²
-                charge=0,
-                twist_angle=math.pi/2,
-                period=10.0,
-                color='#ffff44'
-            )
-        }
+        # Standard fermions are shared, immutable module-level tables
+        self.standard_fermions = _STANDARD_FERMIONS
+        self.fermion_types: List[str] = list(_STANDARD_FERMIONS)
+        self._soa = _STANDARD_SOA
     
-    def create_fermion(self, fermion_type: str) -> FermionSKB:
-        """Create a fermion of the specified type."""
+    def _get_properties(self, fermion_type: str) -> FermionProperties:
+        """Look up the standard properties of a fermion type."""
         if fermion_type not in self.standard_fermions:
             raise ValueError(f"Unknown fermion type: {fermion_type}")
-        
-        properties = self.standard_fermions[fermion_type]
+        return self.standard_fermions[fermion_type]
+    
+    def create_fermion(self, fermion_type: str) -> FermionSKB:
+        """Create a fermion of the specified type."""
+        properties = self._get_properties(fermion_type)
         fermion = FermionSKB(properties)
         self.fermions.append(fermion)
         return fermion
@@ -372,12 +474,13 @@ class FermionEvolutionSystem:
         Returns:
             Dictionary with lifetime calculation results
         """
-        # Create neutron (udd) and proton (uud) systems
-        down_quark = self.create_fermion('down')
-        up_quark = self.create_fermion('up')
+        # Neutron (udd) → proton (uud): only the quark properties are needed,
+        # so no FermionSKB instances are created or tracked
+        down_quark = self._get_properties('down')
+        up_quark = self._get_properties('up')
         
         # Beta decay transition: d → u + W⁻
-        transition_data = down_quark.calculate_beta_decay_transition(up_quark, 0)
+        transition_data = FermionSKB._beta_decay_transition_props(down_quark, up_quark, 0)
         
         # Neutron lifetime = 1 / decay_rate
         lifetime = 1.0 / transition_data['decay_rate'] if transition_data['decay_rate'] > 0 else np.inf
@@ -406,8 +509,8 @@ class FermionEvolutionSystem:
         Returns:
             Cross section calculation results
         """
-        f1 = self.create_fermion(fermion1)
-        f2 = self.create_fermion(fermion2)
+        f1 = self._get_properties(fermion1)
+        f2 = self._get_properties(fermion2)
         
         # Multi-handle interaction (from paper)
         # σ = 4πr₀² (∑ A_ij)² (1 + spin_factor)
@@ -418,7 +521,7 @@ class FermionEvolutionSystem:
         A_ij = abs(f1.charge * f2.charge)  # Electromagnetic
         
         # Add strong interaction for quarks
-        if 'quark' in f1.properties.name.lower() and 'quark' in f2.properties.name.lower():
+        if 'quark' in f1.name.lower() and 'quark' in f2.name.lower():
             A_ij += 1.0  # Strong coupling contribution
         
         # Spin factor from CTC topology
@@ -433,6 +536,40 @@ class FermionEvolutionSystem:
             'electromagnetic_coupling': abs(f1.charge * f2.charge),
             'spin_factor': spin_factor
         }
+    
+    def calculate_scattering_cross_section_matrix(self) -> Dict[str, np.ndarray]:
+        """
+        Calculate scattering cross sections for all pairs of standard fermions.
+        
+        Vectorized over the structure-of-arrays view; entry [i, j] matches
+        calculate_scattering_cross_section(fermion_types[i], fermion_types[j]).
+        
+        Returns:
+            Cross section matrices keyed like the single-pair result, plus
+            the fermion type order
+        """
+        r0 = 1.0  # Characteristic length scale (fm)
+        
+        # Handle coupling strengths: electromagnetic plus strong for quark pairs
+        abs_charge = np.abs(self._soa['charge'])
+        em_coupling = np.outer(abs_charge, abs_charge)
+        is_quark = self._soa['is_quark']
+        A_ij = em_coupling + np.outer(is_quark, is_quark)
+        
+        # Spin factor from CTC topology
+        sin2 = np.sin(self._soa['twist_angle'])**2
+        spin_factor = 0.25 * np.outer(sin2, sin2)
+        
+        # Cross section
+        cross_section = 4 * math.pi * r0**2 * A_ij**2 * (1 + spin_factor)
+        
+        return {
+            'fermion_types': list(self.fermion_types),
+            'cross_section_natural': cross_section,
+            'cross_section_barns': cross_section * 10,  # Convert to barns (approximation)
+            'electromagnetic_coupling': em_coupling,
+            'spin_factor': spin_factor
+        }
 
 
 # Export commonly used functions
@@ -5,13 +5,26 @@ Provides enhanced parametric equations and topological analysis for Klein bottle
 
 import numpy as np
 import logging
-from typing import Tuple, Dict, Any, Optional
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Tuple, Dict, Any, Iterator, Optional
 
 from ..utils.cache import cached_klein_bottle
+from .utils import cached_linspace, ctc_time_twist, low_rank_grid, quantize_surface_parameters
+from .curvature import SurfaceDerivatives, calculate_gaussian_curvature, calculate_surface_derivatives
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Topological invariants shared by every Klein bottle surface
+_CONSTANT_PROPS = MappingProxyType({
+    'euler_characteristic': 0,  # Klein bottle: χ = 0
+    'genus': 2,  # Klein bottle: genus = 2 in 4D
+    'orientable': False,  # Klein bottle is non-orientable
+    'stiefel_whitney_w1': 1,  # Non-trivial for non-orientable surfaces
+    'surface_type': 'Klein Bottle'
+})
 
 class KleinBottleParametrics:
     """Handles Klein bottle parametric equations and surface generation."""
@@ -21,6 +34,8 @@ class KleinBottleParametrics:
         self.resolution = min(resolution, settings.max_surface_resolution)
         self.numerical_precision = settings.numerical_precision
         self.stability_threshold = settings.stability_threshold
+        # Coordinates are only rendered, so single precision is sufficient
+        self._dtype = np.float32
     
     def generate_surface_coordinates(
         self, 
@@ -44,14 +59,13 @@ class KleinBottleParametrics:
         time_param = self._validate_time_param(time_param)
         loop_factor = max(1.0, min(5.0, loop_factor))
         
-        # Generate parameter meshgrid
-        u = np.linspace(0, 2 * np.pi * loop_factor, self.resolution)
-        v = np.linspace(0, 2 * np.pi, self.resolution)
-        u_mesh, v_mesh = np.meshgrid(u, v)
+        # Parameter axes as broadcastable row/column vectors (no meshgrid)
+        u = cached_linspace(0, 2 * np.pi * loop_factor, self.resolution, self._dtype)[np.newaxis, :]
+        v = cached_linspace(0, 2 * np.pi, self.resolution, self._dtype)[:, np.newaxis]
         
         # Compute enhanced surface
         return self._compute_enhanced_surface(
-            u_mesh, v_mesh, kx, ky, kz, kt, time_param, loop_factor
+            u, v, kx, ky, kz, kt, time_param, loop_factor
         )
     
     def _validate_twists(self, twists: Tuple[float, float, float, float]) -> Tuple[float, float, float, float]:
@@ -80,14 +94,18 @@ class KleinBottleParametrics:
         t: float, 
         loop_factor: float
     ) -> Dict[str, np.ndarray]:
-        """Compute enhanced Klein bottle surface with topological deformations."""
+        """Compute enhanced Klein bottle surface with topological deformations.
+        
+        ``u`` is a row vector and ``v`` a column vector; trig is evaluated on
+        the 1D vectors and the grids are only materialized by the final
+        low-rank products.
+        """
         # Enhanced time twist modeling for CTC visualization
-        time_factor = kt * np.sin(u + t) * 0.2
-        stability_factor = 1.0 / (1.0 + abs(kt) * 2)
+        time_factor, twist = ctc_time_twist(u, t, kt, amplitude=0.2, stability_gain=2)
         
         # Dynamic Klein bottle parameters with twist effects
-        a = 2.5 + 0.3 * np.sin(kx * t / 10)  # Dynamic major radius
-        b = 1.2 + 0.2 * np.cos(ky * t / 10)  # Dynamic minor radius
+        a = float(2.5 + 0.3 * np.sin(kx * t / 10))  # Dynamic major radius
+        b = float(1.2 + 0.2 * np.cos(ky * t / 10))  # Dynamic minor radius
         
         # Enhanced parametric equations with temporal evolution
         cos_u = np.cos(u + kx * t / 8)
@@ -96,20 +114,20 @@ class KleinBottleParametrics:
         sin_v = np.sin(v + kz * t / 12)
         cos_2v = np.cos(2 * v + kz * t / 6)
         
-        # Figure-8 Klein bottle immersion with enhanced topology
-        x = (a + b * cos_v) * cos_u
-        y = (a + b * cos_v) * sin_u
-        z = b * sin_v * cos_u / 2 + b * cos_2v * sin_u / 4
-        
-        # Apply time twist effects for CTC visualization
-        x += time_factor * np.cos(v) * stability_factor
-        y += time_factor * np.sin(v) * stability_factor
-        z += time_factor * np.sin(u / loop_factor) * 0.15
+        # Figure-8 Klein bottle immersion with enhanced topology and the time
+        # twist effects for CTC visualization. Every coordinate is a sum of
+        # (v-factor × u-factor) terms, so each grid is one low-rank product.
+        radial = a + b * cos_v
+        x = low_rank_grid((radial, np.cos(v)), (cos_u, twist))
+        y = low_rank_grid((radial, np.sin(v)), (sin_u, twist))
+        z = low_rank_grid(
+            (0.5 * b * sin_v, 0.25 * b * cos_2v, np.ones_like(v)),
+            (cos_u, sin_u, time_factor * np.sin(u / loop_factor) * 0.15)
+        )
         
-        # Apply numerical precision
-        x = np.round(x, self.numerical_precision)
-        y = np.round(y, self.numerical_precision)
-        z = np.round(z, self.numerical_precision)
+        # Expose the parameter grids as read-only broadcast views
+        u = np.broadcast_to(u, x.shape)
+        v = np.broadcast_to(v, x.shape)
         
         return {'x': x, 'y': y, 'z': z, 'u': u, 'v': v}
 
@@ -126,19 +144,14 @@ class KleinBottleTopology:
         x: np.ndarray, 
         y: np.ndarray, 
         z: np.ndarray,
-        twists: Tuple[float, float, float, float]
+        twists: Tuple[float, float, float, float],
+        derivatives: Optional[SurfaceDerivatives] = None
     ) -> Dict[str, Any]:
         """Calculate topological properties of the Klein bottle surface."""
         kx, ky, kz, kt = twists
         
-        # Calculate basic topological invariants
-        euler_characteristic = 0  # Klein bottle: χ = 0
-        genus = 2  # Klein bottle: genus = 2 in 4D
-        orientable = False  # Klein bottle is non-orientable
-        
-        # Calculate Stiefel-Whitney classes
-        w1_class = 1  # Non-trivial for non-orientable surfaces
-        w2_class = self._calculate_w2_class(x, y, z)
+        # Calculate second Stiefel-Whitney class (w1 is constant)
+        w2_class = self._calculate_w2_class(x, y, z, derivatives)
         
         # Calculate intersection form signature
         intersection_form = self._calculate_intersection_form(twists)
@@ -150,22 +163,18 @@ class KleinBottleTopology:
         topological_charge = self._calculate_topological_charge(x, y, z)
         
         return {
-            'euler_characteristic': euler_characteristic,
-            'genus': genus,
-            'orientable': orientable,
-            'stiefel_whitney_w1': w1_class,
+            **_CONSTANT_PROPS,
             'stiefel_whitney_w2': w2_class,
             'intersection_form': intersection_form,
             'ctc_stability': ctc_stability,
-            'topological_charge': topological_charge,
-            'surface_type': 'Klein Bottle'
+            'topological_charge': topological_charge
         }
     
-    def _calculate_w2_class(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> int:
+    def _calculate_w2_class(self, x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                            derivatives: Optional[SurfaceDerivatives] = None) -> int:
         """Calculate second Stiefel-Whitney class."""
-        from .curvature import calculate_gaussian_curvature
-        curvature = calculate_gaussian_curvature(x, y, z)
-        return 1 if np.mean(np.abs(curvature)) > self.stability_threshold else 0
+        curvature = calculate_gaussian_curvature(x, y, z, derivatives)
+        return 1 if np.mean(np.abs(curvature), dtype=np.float64) > self.stability_threshold else 0
     
     def _calculate_intersection_form(self, twists: Tuple[float, float, float, float]) -> str:
         """Calculate intersection form type."""
@@ -191,43 +200,53 @@ class KleinBottleTopology:
         z_sample = z[::sample_step, ::sample_step]
         
         # Calculate approximate winding number
-        center_x, center_y, center_z = np.mean(x_sample), np.mean(y_sample), np.mean(z_sample)
+        center_x = np.mean(x_sample, dtype=np.float64)
+        center_y = np.mean(y_sample, dtype=np.float64)
+        center_z = np.mean(z_sample, dtype=np.float64)
         
         # Vector from center to surface points
         dx = x_sample - center_x
         dy = y_sample - center_y
         dz = z_sample - center_z
         
-        # Normalize vectors
-        norm = np.sqrt(dx**2 + dy**2 + dz**2) + 1e-10
-        dx, dy, dz = dx/norm, dy/norm, dz/norm
-        
-        # Calculate approximate charge
-        charge = np.mean(dx * np.roll(dy, 1, axis=0) - dy * np.roll(dx, 1, axis=0))
-        
+        # Normalize vectors: only the x/y components enter the charge, so
+        # scale those two by a single reciprocal norm per point
+        inv_norm = 1.0 / (np.sqrt(dx**2 + dy**2 + dz**2) + 1e-10)
+        dx *= inv_norm
+        dy *= inv_norm
+
+        # Calculate approximate charge: each row is paired with the previous
+        # one (cyclically), using slice views instead of rolled copies
+        cross_sum = np.sum(dx[1:] * dy[:-1] - dy[1:] * dx[:-1], dtype=np.float64)
+        cross_sum += np.sum(dx[0] * dy[-1] - dy[0] * dx[-1], dtype=np.float64)
+        charge = cross_sum / dx.size
+
         return float(np.round(charge, 4))
 
 
 class KleinBottleQuality:
     """Handles surface quality metrics and analysis."""
     
-    def calculate_metrics(self, surface_data: Dict[str, np.ndarray]) -> Dict[str, float]:
+    def calculate_metrics(self, surface_data: Dict[str, np.ndarray],
+                          derivatives: Optional[SurfaceDerivatives] = None) -> Dict[str, float]:
         """Calculate surface quality metrics."""
         x, y, z = surface_data['x'], surface_data['y'], surface_data['z']
+        if derivatives is None:
+            derivatives = calculate_surface_derivatives(x, y, z)
         
         # Calculate surface area (approximate)
-        surface_area = self._approximate_surface_area(x, y, z)
+        surface_area = self._approximate_surface_area(x, y, z, derivatives)
         
         # Calculate volume (for closed surfaces)
         volume = self._approximate_volume(x, y, z)
         
         # Calculate smoothness metric
-        smoothness = self._calculate_smoothness(x, y, z)
+        smoothness = self._calculate_smoothness(x, y, z, derivatives)
         
         # Calculate aspect ratio
-        x_range = np.max(x) - np.min(x)
-        y_range = np.max(y) - np.min(y)
-        z_range = np.max(z) - np.min(z)
+        x_range = np.ptp(x)
+        y_range = np.ptp(y)
+        z_range = np.ptp(z)
         aspect_ratio = max(x_range, y_range, z_range) / min(x_range, y_range, z_range)
         
         return {
@@ -239,57 +258,150 @@ class KleinBottleQuality:
             'num_points': x.size
         }
     
-    def _approximate_surface_area(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> float:
+    def _approximate_surface_area(self, x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                                  derivatives: Optional[SurfaceDerivatives] = None) -> float:
         """Approximate surface area using finite differences."""
-        dx_du = np.gradient(x, axis=1)
-        dy_du = np.gradient(y, axis=1)
-        dz_du = np.gradient(z, axis=1)
-        
-        dx_dv = np.gradient(x, axis=0)
-        dy_dv = np.gradient(y, axis=0)
-        dz_dv = np.gradient(z, axis=0)
+        if derivatives is None:
+            derivatives = calculate_surface_derivatives(x, y, z)
         
-        # Cross product magnitude
-        cross_x = dy_du * dz_dv - dz_du * dy_dv
-        cross_y = dz_du * dx_dv - dx_du * dz_dv
-        cross_z = dx_du * dy_dv - dy_du * dx_dv
+        # Cross product magnitude on the stacked (3, rows, cols) derivatives
+        cross = np.cross(derivatives.du, derivatives.dv, axis=0)
+        cross_magnitude = np.linalg.norm(cross, axis=0)
         
-        cross_magnitude = np.sqrt(cross_x**2 + cross_y**2 + cross_z**2)
-        
-        return np.sum(cross_magnitude) * (2 * np.pi / len(x))**2
+        return np.sum(cross_magnitude, dtype=np.float64) * (2 * np.pi / len(x))**2
     
     def _approximate_volume(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> float:
         """Approximate volume using divergence theorem."""
-        center_x, center_y, center_z = np.mean(x), np.mean(y), np.mean(z)
-        
-        # Calculate distances from center
-        distances = np.sqrt((x - center_x)**2 + (y - center_y)**2 + (z - center_z)**2)
-        
-        # Approximate volume as integral of distances
-        return float(np.mean(distances**3) * 8 * np.pi / 3)
+        center_x = np.mean(x, dtype=np.float64)
+        center_y = np.mean(y, dtype=np.float64)
+        center_z = np.mean(z, dtype=np.float64)
+        
+        # Squared distances from center, accumulated in one reused buffer pair
+        dist_sq = x - center_x
+        dist_sq *= dist_sq
+        scratch = y - center_y
+        scratch *= scratch
+        dist_sq += scratch
+        np.subtract(z, center_z, out=scratch)
+        scratch *= scratch
+        dist_sq += scratch
+        
+        # Approximate volume as integral of distances (|r|³ = (|r|²)^1.5)
+        np.power(dist_sq, 1.5, out=dist_sq)
+        return float(np.mean(dist_sq, dtype=np.float64) * 8 * np.pi / 3)
     
-    def _calculate_smoothness(self, x: np.ndarray, y: np.ndarray, z: np.ndarray) -> float:
+    def _calculate_smoothness(self, x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                              derivatives: Optional[SurfaceDerivatives] = None) -> float:
         """Calculate surface smoothness metric."""
-        # Calculate second derivatives
-        d2x_du2 = np.gradient(np.gradient(x, axis=1), axis=1)
-        d2y_du2 = np.gradient(np.gradient(y, axis=1), axis=1)
-        d2z_du2 = np.gradient(np.gradient(z, axis=1), axis=1)
-        
-        d2x_dv2 = np.gradient(np.gradient(x, axis=0), axis=0)
-        d2y_dv2 = np.gradient(np.gradient(y, axis=0), axis=0)
-        d2z_dv2 = np.gradient(np.gradient(z, axis=0), axis=0)
-        
-        # Calculate curvature magnitude
-        curvature_magnitude = np.sqrt(
-            d2x_du2**2 + d2y_du2**2 + d2z_du2**2 +
-            d2x_dv2**2 + d2y_dv2**2 + d2z_dv2**2
-        )
+        # Second derivatives
+        if derivatives is None:
+            derivatives = calculate_surface_derivatives(x, y, z)
+        duu, dvv = derivatives.duu, derivatives.dvv
+        
+        # Calculate curvature magnitude: squared norms over the stacked
+        # components, accumulated in place
+        curvature_magnitude = np.einsum('ijk,ijk->jk', duu, duu)
+        curvature_magnitude += np.einsum('ijk,ijk->jk', dvv, dvv)
+        np.sqrt(curvature_magnitude, out=curvature_magnitude)
         
         # Smoothness is inverse of mean curvature magnitude
-        mean_curvature = np.mean(curvature_magnitude)
+        mean_curvature = np.mean(curvature_magnitude, dtype=np.float64)
         return 1.0 / (1.0 + mean_curvature)
 
 
+class KleinBottleSurface(Mapping):
+    """
+    Generated Klein bottle surface with lazily computed analysis.
+    
+    Behaves like the read-only result dict (x, y, z, u, v,
+    topological_properties, quality_metrics, parameters), but the topology
+    and quality analyses are only computed the first time either of them
+    is accessed.
+    """
+    
+    _LAZY_KEYS = ('topological_properties', 'quality_metrics')
+    
+    def __init__(
+        self,
+        surface_data: Dict[str, np.ndarray],
+        twists: Tuple[float, float, float, float],
+        parameters: Dict[str, Any],
+        topology: 'KleinBottleTopology',
+        quality: 'KleinBottleQuality'
+    ):
+        """Wrap surface coordinates with the analyzers used on demand."""
+        self._surface_data = surface_data
+        self._twists = twists
+        self._parameters = parameters
+        self._topology = topology
+        self._quality = quality
+    
+    @cached_property
+    def _analysis(self) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        Topological properties and quality metrics, computed together.
+        
+        Both analyses share one derivative pass. The derivatives are kept
+        local so cached surfaces do not hold on to them.
+        """
+        data = self._surface_data
+        derivatives = calculate_surface_derivatives(data['x'], data['y'], data['z'])
+        return (
+            self._topology.calculate_properties(
+                data['x'], data['y'], data['z'], self._twists, derivatives
+            ),
+            self._quality.calculate_metrics(data, derivatives)
+        )
+    
+    @property
+    def topological_properties(self) -> Dict[str, Any]:
+        """Topological properties of the surface."""
+        return self._analysis[0]
+    
+    @property
+    def quality_metrics(self) -> Dict[str, float]:
+        """Surface quality metrics."""
+        return self._analysis[1]
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the coordinate arrays, without running the analysis."""
+        return sum(array.nbytes for array in self._surface_data.values())
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._LAZY_KEYS:
+            return getattr(self, key)
+        if key == 'parameters':
+            return self._parameters
+        return self._surface_data[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self._surface_data
+        yield from self._LAZY_KEYS
+        yield 'parameters'
+    
+    def __len__(self) -> int:
+        return len(self._surface_data) + len(self._LAZY_KEYS) + 1
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Materialize the lazy analysis before the surface is pickled.
+        
+        Shared caches store pickled surfaces, so without this every hit
+        would recompute the analysis. Building the state explicitly also
+        keeps pickling from iterating ``__dict__`` while another thread
+        fills in the cached analysis.
+        """
+        return {
+            '_surface_data': self._surface_data,
+            '_twists': self._twists,
+            '_parameters': self._parameters,
+            '_topology': self._topology,
+            '_quality': self._quality,
+            '_analysis': self._analysis
+        }
+
+
 class KleinBottleGenerator:
     """Main Klein bottle generator that coordinates all components."""
     
@@ -299,53 +411,69 @@ class KleinBottleGenerator:
         self.parametrics = KleinBottleParametrics(resolution)
         self.topology = KleinBottleTopology()
         self.quality = KleinBottleQuality()
-        
-    @cached_klein_bottle()
+    
     def generate_parametric_surface(
         self, 
         twists: Tuple[float, float, float, float],
         time_param: float,
         loop_factor: float
-    ) -> Dict[str, Any]:
-        """Generate enhanced Klein bottle parametric surface."""
-        logger.debug(f"Generating Klein bottle with twists={twists}, t={time_param}, loops={loop_factor}")
+    ) -> 'KleinBottleSurface':
+        """Generate enhanced Klein bottle parametric surface.
         
-        # Generate surface coordinates
-        surface_data = self.parametrics.generate_surface_coordinates(
-            twists, time_param, loop_factor
-        )
-        
-        # Calculate topological properties
-        topological_props = self.topology.calculate_properties(
-            surface_data['x'], surface_data['y'], surface_data['z'], twists
+        Parameters are quantized before they reach the cache so that slider
+        values differing only in the last few decimals share one entry.
+        Topological properties and quality metrics are computed lazily, on
+        first access of the corresponding key.
+        """
+        return _generate_parametric_surface(
+            self.resolution,
+            *quantize_surface_parameters(twists, time_param, loop_factor)
         )
-        
-        # Calculate surface quality metrics
-        quality_metrics = self.quality.calculate_metrics(surface_data)
-        
-        return {
-            **surface_data,
-            'topological_properties': topological_props,
-            'quality_metrics': quality_metrics,
-            'parameters': {
-                'twists': twists,
-                'time_param': time_param,
-                'loop_factor': loop_factor,
-                'resolution': self.resolution
-            }
-        }
 
 
-# Global Klein bottle generator instance
-_klein_bottle_generator: Optional[KleinBottleGenerator] = None
+@cached_klein_bottle()
+def _generate_parametric_surface(
+    resolution: int,
+    twists: Tuple[float, float, float, float],
+    time_param: float,
+    loop_factor: float
+) -> KleinBottleSurface:
+    """Build the surface for a resolution and already-quantized parameters.
+    
+    A module-level function so that the cache key holds the resolution
+    itself rather than a hash of the whole generator.
+    """
+    logger.debug(f"Generating Klein bottle with twists={twists}, t={time_param}, loops={loop_factor}")
+    generator = get_klein_bottle_generator(resolution)
+    
+    # Generate surface coordinates
+    surface_data = generator.parametrics.generate_surface_coordinates(
+        twists, time_param, loop_factor
+    )
+    
+    return KleinBottleSurface(
+        surface_data,
+        twists,
+        {
+            'twists': twists,
+            'time_param': time_param,
+            'loop_factor': loop_factor,
+            'resolution': resolution
+        },
+        generator.topology,
+        generator.quality
+    )
 
 
+@lru_cache(maxsize=8)
 def get_klein_bottle_generator(resolution: int = 75) -> KleinBottleGenerator:
-    """Get global Klein bottle generator instance."""
-    global _klein_bottle_generator
-    if _klein_bottle_generator is None or _klein_bottle_generator.resolution != resolution:
-        _klein_bottle_generator = KleinBottleGenerator(resolution)
-    return _klein_bottle_generator
+    """Get the shared Klein bottle generator instance for a resolution.
+    
+    One generator is kept per resolution, so callers using different
+    resolutions (e.g. the single-SKB and multi-surface views) do not
+    rebuild each other's generator on every request.
+    """
+    return KleinBottleGenerator(resolution)
 
 
 # Convenience functions
@@ -354,7 +482,7 @@ def generate_klein_bottle(
     time_param: float = 0.0,
     loop_factor: float = 1.0,
     resolution: int = 75
-) -> Dict[str, Any]:
+) -> Mapping[str, Any]:
     """Generate Klein bottle surface with given parameters."""
     generator = get_klein_bottle_generator(resolution)
     return generator.generate_parametric_surface(twists, time_param, loop_factor)
@@ -363,6 +491,7 @@ def generate_klein_bottle(
 # Export public interface
 __all__ = [
     "KleinBottleGenerator",
+    "KleinBottleSurface",
     "KleinBottleParametrics",
     "KleinBottleTopology", 
     "KleinBottleQuality",
@@ -5,10 +5,25 @@ Provides parametric equations and surface generation for various topological sur
 
 import numpy as np
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Tuple, Dict, Any
 
+from .utils import cached_linspace, ctc_time_twist, low_rank_grid
+from .curvature import U_AXIS, V_AXIS
+
 logger = logging.getLogger(__name__)
 
+# Surfaces are only rendered (WebGL uses float32), so single precision is
+# sufficient; override for callers that need double precision
+_DTYPE = np.float32
+
+# Curvature only drives the color map, so it is evaluated on a strided subgrid
+# and interpolated back; grids whose subgrid would fall below the minimum
+# sample count are colored at full resolution
+_CURVATURE_DOWNSAMPLE = 4
+_CURVATURE_MIN_SAMPLES = 16
+
 
 def mobius_strip_parametric(u: np.ndarray, v: np.ndarray, radius: float = 2.0, width: float = 0.5) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
@@ -55,6 +70,35 @@ def torus_parametric(u: np.ndarray, v: np.ndarray, R: float = 2.0, r: float = 0.
     return x, y, z
 
 
+@lru_cache(maxsize=64)
+def _twisted_strip_profile(kx: float, ky: float, kz: float, loop_factor: float,
+                           resolution: int) -> Tuple[np.ndarray, ...]:
+    """
+    Time-independent rows of the twisted strip for one twist configuration.
+    
+    Args:
+        kx, ky, kz: Spatial twist parameters
+        loop_factor: Number of loops
+        resolution: Surface resolution
+        
+    Returns:
+        Read-only (u, v, radius, width_modulation, z_twist, loop_sin), where u
+        and the modulation rows are (1, resolution) and v is a column
+    """
+    u = cached_linspace(0, 2 * np.pi * loop_factor, resolution, _DTYPE)[np.newaxis, :]
+    v = cached_linspace(-0.75, 0.75, int(resolution * 0.6), _DTYPE)[:, np.newaxis]
+    
+    # Enhanced Möbius strip with multi-dimensional twists
+    radius = 2.0 + 0.3 * np.sin(kx * u / loop_factor)
+    width_modulation = 0.75 + 0.2 * np.sin(ky * u / loop_factor)
+    z_twist = np.cos(kz * u / loop_factor)
+    loop_sin = np.sin(u / loop_factor)
+    
+    for row in (radius, width_modulation, z_twist, loop_sin):
+        row.flags.writeable = False
+    return u, v, radius, width_modulation, z_twist, loop_sin
+
+
 def generate_twisted_strip(twists: list, t: float, loop_factor: float, resolution: int = 75) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Generate an enhanced twisted strip (sub-SKB) with improved mathematical modeling.
@@ -68,37 +112,40 @@ def generate_twisted_strip(twists: list, t: float, loop_factor: float, resolutio
     Returns:
         Tuple of x, y, z, u, v arrays
     """
-    u = np.linspace(0, 2 * np.pi * loop_factor, resolution)
-    v = np.linspace(-0.75, 0.75, int(resolution * 0.6))
-    u, v = np.meshgrid(u, v)
-    
     kx, ky, kz, kt = twists
     
-    # Enhanced time twist effect with better CTC modeling
-    time_factor = kt * np.sin(u + t) * 0.25
-    stability_factor = 1.0 / (1.0 + abs(kt))
+    # Row/column parameter vectors and the time-independent modulation rows,
+    # evaluated once per (twists, loop_factor, resolution)
+    u, v, radius, width_modulation, z_twist, loop_sin = _twisted_strip_profile(
+        kx, ky, kz, loop_factor, resolution
+    )
     
-    # Enhanced Möbius strip with multi-dimensional twists
-    radius = 2.0 + 0.3 * np.sin(kx * u / loop_factor)
-    width_modulation = 0.75 + 0.2 * np.sin(ky * u / loop_factor)
-    
-    # Apply twist effects
-    cos_u_2 = np.cos((u + kx * t / 5) / 2)
-    sin_u_2 = np.sin((u + kx * t / 5) / 2)
-    cos_u = np.cos(u + ky * t / 5)
-    sin_u = np.sin(u + ky * t / 5)
-    
-    # Enhanced parametric equations
-    x = (radius + v * width_modulation * cos_u_2) * cos_u
-    y = (radius + v * width_modulation * cos_u_2) * sin_u
-    z = v * width_modulation * sin_u_2 * np.cos(kz * u / loop_factor)
-    
-    # Apply time twist effect for CTC visualization
-    x = x + time_factor * np.cos(v) * stability_factor
-    y = y + time_factor * np.sin(v) * stability_factor
-    z = z + time_factor * np.sin(u / loop_factor) * 0.1
-    
-    return x, y, z, u, v
+    # Enhanced time twist effect with better CTC modeling
+    time_factor, twist = ctc_time_twist(u, t, kt, amplitude=0.25, stability_gain=1)
+    
+    # Apply twist effects; each phase row is evaluated once and shared by
+    # its sin/cos pair
+    half_phase = (u + kx * t / 5) / 2
+    phase = u + ky * t / 5
+    cos_u_2 = np.cos(half_phase)
+    sin_u_2 = np.sin(half_phase)
+    cos_u = np.cos(phase)
+    sin_u = np.sin(phase)
+    
+    # Enhanced parametric equations with the time twist effect for CTC
+    # visualization. Each coordinate is a sum of (v-factor × u-factor)
+    # terms, so each grid is one low-rank product.
+    ones = np.ones_like(v)
+    width_cos = width_modulation * cos_u_2
+    x = low_rank_grid((ones, v, np.cos(v)), (radius * cos_u, width_cos * cos_u, twist))
+    y = low_rank_grid((ones, v, np.sin(v)), (radius * sin_u, width_cos * sin_u, twist))
+    z = low_rank_grid(
+        (v, ones),
+        (width_modulation * sin_u_2 * z_twist, time_factor * loop_sin * 0.1)
+    )
+    
+    # Parameter grids as read-only broadcast views
+    return x, y, z, np.broadcast_to(u, x.shape), np.broadcast_to(v, x.shape)
 
 
 def generate_torus(twists: list, t: float, loop_factor: float, resolution: int = 75) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
@@ -114,19 +161,18 @@ def generate_torus(twists: list, t: float, loop_factor: float, resolution: int =
     Returns:
         Tuple of x, y, z, u, v arrays
     """
-    u = np.linspace(0, 2 * np.pi * loop_factor, resolution)
-    v = np.linspace(0, 2 * np.pi, resolution)
-    u, v = np.meshgrid(u, v)
+    # Row/column parameter vectors; the grid is formed by broadcasting
+    u = cached_linspace(0, 2 * np.pi * loop_factor, resolution, _DTYPE)[np.newaxis, :]
+    v = cached_linspace(0, 2 * np.pi, resolution, _DTYPE)[:, np.newaxis]
     
     kx, ky, kz, kt = twists
     
     # Enhanced time twist modeling
-    time_factor = kt * np.sin(u + t) * 0.2
-    stability_factor = 1.0 / (1.0 + abs(kt) * 1.5)
+    time_factor, twist = ctc_time_twist(u, t, kt, amplitude=0.2, stability_gain=1.5)
     
     # Dynamic torus parameters
-    R = 2.2 + 0.2 * np.sin(kx * t / 8)  # Major radius variation
-    r = 0.6 + 0.1 * np.cos(ky * t / 8)  # Minor radius variation
+    R = float(2.2 + 0.2 * np.sin(kx * t / 8))  # Major radius variation
+    r = float(0.6 + 0.1 * np.cos(ky * t / 8))  # Minor radius variation
     
     # Enhanced torus parametric equations with twist effects
     cos_u = np.cos(u + ky * t / 10)
@@ -134,16 +180,19 @@ def generate_torus(twists: list, t: float, loop_factor: float, resolution: int =
     cos_v = np.cos(v + kz * t / 12)
     sin_v = np.sin(v + kz * t / 12)
     
-    x = (R + r * cos_v) * cos_u
-    y = (R + r * cos_v) * sin_u
-    z = r * sin_v * (1 + 0.1 * np.sin(kz * u / loop_factor))
-    
-    # Apply time twist effect for CTC visualization
-    x = x + time_factor * np.cos(v) * stability_factor
-    y = y + time_factor * np.sin(v) * stability_factor
-    z = z + time_factor * np.cos(u / loop_factor) * 0.1
-    
-    return x, y, z, u, v
+    # Torus equations with the time twist effect for CTC visualization,
+    # assembled as low-rank products like the twisted strip
+    radial = R + r * cos_v
+    x = low_rank_grid((radial, np.cos(v)), (cos_u, twist))
+    y = low_rank_grid((radial, np.sin(v)), (sin_u, twist))
+    z = low_rank_grid(
+        (r * sin_v, np.ones_like(v)),
+        (1 + 0.1 * np.sin(kz * u / loop_factor),
+         time_factor * np.cos(u / loop_factor) * 0.1)
+    )
+    
+    # Parameter grids as read-only broadcast views
+    return x, y, z, np.broadcast_to(u, x.shape), np.broadcast_to(v, x.shape)
 
 
 def generate_mobius_strip(twists: list, t: float, loop_factor: float, resolution: int = 75) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
@@ -173,33 +222,126 @@ def calculate_surface_curvature(x: np.ndarray, y: np.ndarray, z: np.ndarray) ->
         Array of curvature values for color mapping
     """
     # Simple finite difference approximation of curvature
-    dx_du = np.gradient(x, axis=1)
-    dy_du = np.gradient(y, axis=1)
-    dz_du = np.gradient(z, axis=1)
+    dx_du = np.gradient(x, axis=U_AXIS)
+    dy_du = np.gradient(y, axis=U_AXIS)
+    dz_du = np.gradient(z, axis=U_AXIS)
     
-    dx_dv = np.gradient(x, axis=0)
-    dy_dv = np.gradient(y, axis=0)
-    dz_dv = np.gradient(z, axis=0)
+    dx_dv = np.gradient(x, axis=V_AXIS)
+    dy_dv = np.gradient(y, axis=V_AXIS)
+    dz_dv = np.gradient(z, axis=V_AXIS)
     
     # Normal vector approximation
     nx = dy_du * dz_dv - dz_du * dy_dv
     ny = dz_du * dx_dv - dx_du * dz_dv
     nz = dx_du * dy_dv - dy_du * dx_dv
     
-    # Normalize
-    norm = np.sqrt(nx**2 + ny**2 + nz**2) + 1e-10
-    nx, ny, nz = nx/norm, ny/norm, nz/norm
+    # Normalize in place; nx/ny/nz are fresh arrays owned by this function
+    norm = nx * nx
+    norm += ny * ny
+    norm += nz * nz
+    np.sqrt(norm, out=norm)
+    norm += 1e-10
+    np.divide(nx, norm, out=nx)
+    np.divide(ny, norm, out=ny)
+    np.divide(nz, norm, out=nz)
     
     # Approximate mean curvature
-    d2x_du2 = np.gradient(dx_du, axis=1)
-    d2y_du2 = np.gradient(dy_du, axis=1)
-    d2z_du2 = np.gradient(dz_du, axis=1)
+    d2x_du2 = np.gradient(dx_du, axis=U_AXIS)
+    d2y_du2 = np.gradient(dy_du, axis=U_AXIS)
+    d2z_du2 = np.gradient(dz_du, axis=U_AXIS)
     
     mean_curvature = np.abs(d2x_du2 * nx + d2y_du2 * ny + d2z_du2 * nz)
     
     return mean_curvature
 
 
+def _upsample_axis(values: np.ndarray, size: int, factor: int, axis: int) -> np.ndarray:
+    """Linearly interpolate a strided sample of length ceil(size/factor) back to size along axis."""
+    last = values.shape[axis] - 1
+    position = np.minimum(np.arange(size) / factor, last)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, last)
+    shape = [1] * values.ndim
+    shape[axis] = size
+    weight = (position - lower).astype(values.dtype).reshape(shape)
+    lo = np.take(values, lower, axis=axis)
+    return lo + weight * (np.take(values, upper, axis=axis) - lo)
+
+
+def _downsampled_curvature(x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                           factor: int = _CURVATURE_DOWNSAMPLE) -> np.ndarray:
+    """
+    Approximate calculate_surface_curvature from a strided subgrid.
+    
+    Args:
+        x, y, z: Surface coordinate arrays
+        factor: Stride applied along both parameter axes
+        
+    Returns:
+        Curvature array with the shape of x, for color mapping
+    """
+    rows, cols = x.shape
+    if factor <= 1 or min(rows, cols) < factor * _CURVATURE_MIN_SAMPLES:
+        return calculate_surface_curvature(x, y, z)
+    
+    step = (slice(None, None, factor), slice(None, None, factor))
+    # Second differences on a grid with stride ``factor`` are factor² larger
+    # per index step than on the full grid
+    coarse = calculate_surface_curvature(x[step], y[step], z[step])
+    coarse /= factor * factor
+    
+    curvature = _upsample_axis(coarse, rows, factor, V_AXIS)
+    return _upsample_axis(curvature, cols, factor, U_AXIS)
+
+
+# Static trace styling shared by every surface trace; read-only views, so an
+# in-place edit of one trace cannot restyle every later response
+_SURFACE_CONTOURS = MappingProxyType({
+    axis: MappingProxyType({'show': True, 'width': 2, 'color': 'rgba(255,255,255,0.4)'})
+    for axis in 'xyz'
+})
+_SURFACE_LIGHTING = MappingProxyType({
+    'ambient': 0.4,
+    'diffuse': 0.8,
+    'roughness': 0.2,
+    'specular': 0.9,
+    'fresnel': 0.4
+})
+_SURFACE_LIGHTPOSITION = MappingProxyType({
+    'x': 1.5,
+    'y': 1.5,
+    'z': 2.0
+})
+
+
+@lru_cache(maxsize=64)
+def _surface_colorscale(color: Tuple[int, int, int], surface_type: str) -> Tuple[Tuple[float, str], ...]:
+    """
+    Build the (immutable) colorscale for a base color and surface type.
+    
+    Args:
+        color: Base color as RGB tuple
+        surface_type: Type of surface for specialized rendering
+        
+    Returns:
+        Colorscale as a tuple of (position, rgba string) pairs
+    """
+    if surface_type == "Klein":
+        # Klein bottle specific coloring based on topology
+        return (
+            (0.0, f"rgba({color[0]}, {color[1]}, {color[2]}, 0.3)"),
+            (0.3, f"rgba({color[0]}, {color[1]}, {color[2]}, 0.6)"),
+            (0.7, f"rgba({min(255, color[0]+30)}, {min(255, color[1]+30)}, {min(255, color[2]+30)}, 0.8)"),
+            (1.0, f"rgba({min(255, color[0]+50)}, {min(255, color[1]+50)}, {min(255, color[2]+50)}, 1.0)")
+        )
+    # Generic mathematical surface coloring
+    return (
+        (0.0, f"rgba({color[0]}, {color[1]}, {color[2]}, 0.4)"),
+        (0.5, f"rgba({color[0]}, {color[1]}, {color[2]}, 0.7)"),
+        (1.0, f"rgba({min(255, color[0]+40)}, {min(255, color[1]+40)}, {min(255, color[2]+40)}, 0.9)")
+    )
+
+
 def create_enhanced_surface_trace(
     x: np.ndarray, 
     y: np.ndarray, 
@@ -225,59 +367,32 @@ def create_enhanced_surface_trace(
     Returns:
         Dict containing surface trace configuration
     """
-    # Calculate curvature for enhanced coloring
-    curvature = calculate_surface_curvature(x, y, z)
+    # Calculate curvature for enhanced coloring (on a subgrid for large surfaces)
+    curvature = _downsampled_curvature(x, y, z)
     
     # Create enhanced colorscale based on mathematical properties
-    if surface_type == "Klein":
-        # Klein bottle specific coloring based on topology
-        colorscale = [
-            [0.0, f"rgba({color[0]}, {color[1]}, {color[2]}, 0.3)"],
-            [0.3, f"rgba({color[0]}, {color[1]}, {color[2]}, 0.6)"],
-            [0.7, f"rgba({min(255, color[0]+30)}, {min(255, color[1]+30)}, {min(255, color[2]+30)}, 0.8)"],
-            [1.0, f"rgba({min(255, color[0]+50)}, {min(255, color[1]+50)}, {min(255, color[2]+50)}, 1.0)"]
-        ]
-    else:
-        # Generic mathematical surface coloring
-        colorscale = [
-            [0.0, f"rgba({color[0]}, {color[1]}, {color[2]}, 0.4)"],
-            [0.5, f"rgba({color[0]}, {color[1]}, {color[2]}, 0.7)"],
-            [1.0, f"rgba({min(255, color[0]+40)}, {min(255, color[1]+40)}, {min(255, color[2]+40)}, 0.9)"]
-        ]
+    colorscale = _surface_colorscale(tuple(color), surface_type)
     
     # Enhanced surface trace with scientific lighting
     surface_trace = {
-        'x': x.tolist(),
-        'y': y.tolist(),
-        'z': z.tolist(),
-        'surfacecolor': curvature.tolist(),  # Use curvature for coloring
+        # Arrays are serialized by the app's NumPy-aware JSON provider
+        'x': x,
+        'y': y,
+        'z': z,
+        'surfacecolor': curvature,  # Use curvature for coloring
         'type': 'surface',
         'colorscale': colorscale,
         'showscale': False,
         'opacity': opacity,
         'name': name,
         'hoverinfo': 'none',
-        'contours': {
-            'x': {'show': True, 'width': 2, 'color': 'rgba(255,255,255,0.4)'},
-            'y': {'show': True, 'width': 2, 'color': 'rgba(255,255,255,0.4)'},
-            'z': {'show': True, 'width': 2, 'color': 'rgba(255,255,255,0.4)'}
-        },
-        'lighting': {
-            'ambient': 0.4,
-            'diffuse': 0.8,
-            'roughness': 0.2,
-            'specular': 0.9,
-            'fresnel': 0.4
-        },
-        'lightposition': {
-            'x': 1.5,
-            'y': 1.5,
-            'z': 2.0
-        },
+        'contours': _SURFACE_CONTOURS,
+        'lighting': _SURFACE_LIGHTING,
+        'lightposition': _SURFACE_LIGHTPOSITION,
         'hidesurface': False,
         'cauto': False,
-        'cmin': np.min(curvature),
-        'cmax': np.max(curvature)
+        'cmin': float(np.min(curvature)),
+        'cmax': float(np.max(curvature))
     }
     
     return surface_trace 
\ No newline at end of file
@@ -5,10 +5,23 @@ Provides functions for calculating topological properties and field lines.
 
 import numpy as np
 import logging
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Field lines are drawn for field strength 1/(1+d) > 0.3, i.e. twist distance d < 7/3
+_MAX_FIELD_DISTANCE_SQ = (7.0 / 3.0) ** 2
+
+# Curve parameter and its time-independent terms shared by every field line
+_FIELD_LINE_U = np.linspace(0, 1, 20)
+_FIELD_LINE_1MU = 1 - _FIELD_LINE_U
+_FIELD_LINE_PI_U = _FIELD_LINE_U * np.pi
+_FIELD_LINE_SIN_PI_U = np.sin(np.pi * _FIELD_LINE_U)
+for _table in (_FIELD_LINE_U, _FIELD_LINE_1MU, _FIELD_LINE_PI_U, _FIELD_LINE_SIN_PI_U):
+    _table.flags.writeable = False
+del _table
+
 
 def calculate_ctc_stability(twists: List[List[float]]) -> float:
     """
@@ -66,28 +79,40 @@ def generate_topological_field_lines(twists: List[List[float]], t: float) -> Lis
         List of field line traces
     """
     try:
-        field_lines = []
+        # Only Sub-SKBs with at least three spatial twist components connect
+        indices = [k for k, twist in enumerate(twists) if len(twist) >= 3]
+        if len(indices) < 2:
+            return []
+        
+        # Pairwise twist distances via ||a-b||² = ||a||² + ||b||² - 2a·b
+        spatial = np.array([twists[k][:3] for k in indices], dtype=np.float64)
+        sq_norms = np.einsum('ij,ij->i', spatial, spatial)
+        dist_sq = sq_norms[:, np.newaxis] + sq_norms[np.newaxis, :] - 2.0 * (spatial @ spatial.T)
+        
+        # Only show strong connections: 1/(1+d) > 0.3 is tested as d² < (7/3)²
+        rows, cols = np.triu_indices(len(indices), 1)
+        pair_dist_sq = dist_sq[rows, cols]
+        strong = pair_dist_sq < _MAX_FIELD_DISTANCE_SQ
         
-        # Calculate field strength based on twist compatibility
-        for i in range(len(twists)):
-            for j in range(i + 1, len(twists)):
-                if len(twists[i]) < 3 or len(twists[j]) < 3:
-                    continue
-                    
-                twist1, twist2 = twists[i], twists[j]
-                
-                # Calculate topological field strength
-                field_strength = 1.0 / (1.0 + np.sqrt(
-                    (twist1[0] - twist2[0])**2 + 
-                    (twist1[1] - twist2[1])**2 + 
-                    (twist1[2] - twist2[2])**2
-                ))
-                
-                # Only show strong connections
-                if field_strength > 0.3:
-                    field_line = _create_field_line(i, j, twist1, twist2, t, field_strength)
-                    if field_line:
-                        field_lines.append(field_line)
+        # Calculate topological field strength for the surviving pairs only
+        strength = 1.0 / (1.0 + np.sqrt(np.maximum(pair_dist_sq[strong], 0.0)))
+        
+        # One trace per connection, styled by its own field strength
+        field_lines = []
+        for a, b, field_strength in zip(rows[strong].tolist(), cols[strong].tolist(), strength.tolist()):
+            i, j = indices[a], indices[b]
+            field_line = _FIELD_LINE_TEMPLATE.copy()
+            # float32 is plenty for display and halves the serialized size
+            field_line['x'], field_line['y'], field_line['z'] = (
+                coordinate.astype(np.float32)
+                for coordinate in _field_line_segment(i, j, twists[i], twists[j], t)
+            )
+            field_line['line'] = {
+                'width': max(2, int(field_strength * 8)),
+                'color': f'rgba(255, 200, 100, {field_strength * 0.8})'
+            }
+            field_line['name'] = f'Field Line {i+1}-{j+1}'
+            field_lines.append(field_line)
         
         return field_lines
         
@@ -96,63 +121,57 @@ def generate_topological_field_lines(twists: List[List[float]], t: float) -> Lis
         return []
 
 
-def _create_field_line(
+# Static part of every field line trace; per-line fields are filled in on a copy
+_FIELD_LINE_TEMPLATE = {
+    'mode': 'lines',
+    'type': 'scatter3d',
+    'hoverinfo': 'name',
+    'showlegend': False
+}
+
+
+@lru_cache(maxsize=None)
+def _ring_position(index: int) -> Tuple[float, float]:
+    """(x, y) anchor of a Sub-SKB on the radius-2 ring of three surfaces."""
+    angle = index * 2 * np.pi / 3
+    return float(2 * np.cos(angle)), float(2 * np.sin(angle))
+
+
+def _field_line_segment(
     i: int, 
     j: int, 
     twist1: List[float], 
     twist2: List[float], 
-    t: float, 
-    field_strength: float
-) -> Optional[Dict[str, Any]]:
+    t: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
-    Create a single field line between two surfaces.
+    Compute the curve of a single field line between two surfaces.
     
     Args:
         i, j: Surface indices
         twist1, twist2: Twist parameters
         t: Time parameter
-        field_strength: Connection strength
         
     Returns:
-        Field line trace configuration or None
+        Tuple of (x, y, z) point arrays along the curve
     """
-    try:
-        # Generate parametric field line
-        u = np.linspace(0, 1, 20)
-        
-        # Create curved connection based on twist parameters
-        curve_factor = (twist1[0] + twist2[0]) * 0.1 if len(twist1) > 0 and len(twist2) > 0 else 0
-        
-        x_line = (1 - u) * (2 * np.cos(i * 2 * np.pi / 3)) + u * (2 * np.cos(j * 2 * np.pi / 3))
-        y_line = (1 - u) * (2 * np.sin(i * 2 * np.pi / 3)) + u * (2 * np.sin(j * 2 * np.pi / 3))
-        z_line = curve_factor * np.sin(np.pi * u) + 0.2 * np.sin(t + u * np.pi)
-        
-        field_line = {
-            'x': x_line.tolist(),
-            'y': y_line.tolist(),
-            'z': z_line.tolist(),
-            'mode': 'lines',
-            'type': 'scatter3d',
-            'line': {
-                'width': max(2, int(field_strength * 8)),
-                'color': f'rgba(255, 200, 100, {field_strength * 0.8})'
-            },
-            'name': f'Field Line {i+1}-{j+1}',
-            'hoverinfo': 'name',
-            'showlegend': False
-        }
-        return field_line
-        
-    except Exception as e:
-        logger.warning(f"Error creating field line {i}-{j}: {e}")
-        return None
+    # Create curved connection based on twist parameters
+    curve_factor = (twist1[0] + twist2[0]) * 0.1 if len(twist1) > 0 and len(twist2) > 0 else 0
+    
+    # Parametric field line between the two ring positions
+    x_i, y_i = _ring_position(i)
+    x_j, y_j = _ring_position(j)
+    x_line = _FIELD_LINE_1MU * x_i + _FIELD_LINE_U * x_j
+    y_line = _FIELD_LINE_1MU * y_i + _FIELD_LINE_U * y_j
+    z_line = curve_factor * _FIELD_LINE_SIN_PI_U + 0.2 * np.sin(t + _FIELD_LINE_PI_U)
+    return x_line, y_line, z_line
 
 
 def calculate_surface_intersections(
     surface1: Dict[str, Any], 
     surface2: Dict[str, Any], 
     tolerance: float = 0.1
-) -> Optional[Dict[str, List[float]]]:
+) -> Optional[Dict[str, np.ndarray]]:
     """
     Calculate intersections between two surfaces for enhanced visualization.
     
@@ -164,52 +183,56 @@ def calculate_surface_intersections(
         Dictionary with intersection point coordinates or None
     """
     try:
-        # Extract surface coordinates
-        x1, y1, z1 = np.array(surface1['x']), np.array(surface1['y']), np.array(surface1['z'])
-        x2, y2, z2 = np.array(surface2['x']), np.array(surface2['y']), np.array(surface2['z'])
+        # Extract surface coordinates; single precision matches the surface
+        # generators (a no-op for their arrays) and halves the working set
+        # when callers pass nested lists or float64 data
+        x1, y1, z1 = (np.asarray(surface1[k], dtype=np.float32) for k in ('x', 'y', 'z'))
+        x2, y2, z2 = (np.asarray(surface2[k], dtype=np.float32) for k in ('x', 'y', 'z'))
         
         # Sample points for intersection calculation
         sample_step = max(1, len(x1) // 20)
+        sample = (slice(None, None, sample_step), slice(None, None, sample_step))
+        points1 = np.column_stack((x1[sample].ravel(), y1[sample].ravel(), z1[sample].ravel()))
+        points2 = np.column_stack((x2[sample].ravel(), y2[sample].ravel(), z2[sample].ravel()))
         
-        intersections_x, intersections_y, intersections_z = [], [], []
-        
-        # Optimized intersection detection
-        for i in range(0, len(x1), sample_step):
-            for j in range(0, len(x1[0]), sample_step):
-                if i < len(x1) and j < len(x1[0]):
-                    p1 = np.array([x1[i][j], y1[i][j], z1[i][j]])
-                    
-                    # Find closest point on surface2
-                    min_dist = float('inf')
-                    closest_point = None
-                    
-                    for ii in range(0, len(x2), sample_step):
-                        for jj in range(0, len(x2[0]), sample_step):
-                            if ii < len(x2) and jj < len(x2[0]):
-                                p2 = np.array([x2[ii][jj], y2[ii][jj], z2[ii][jj]])
-                                dist = np.linalg.norm(p1 - p2)
-                                
-                                if dist < min_dist:
-                                    min_dist = dist
-                                    closest_point = p2
-                    
-                    # If points are close enough, consider it an intersection
-                    if min_dist < tolerance and closest_point is not None:
-                        # Add midpoint as intersection
-                        midpoint = (p1 + closest_point) / 2
-                        intersections_x.append(float(midpoint[0]))
-                        intersections_y.append(float(midpoint[1]))
-                        intersections_z.append(float(midpoint[2]))
-        
-        if intersections_x:
-            return {
-                'x': intersections_x,
-                'y': intersections_y,
-                'z': intersections_z
-            }
-        else:
+        # Find the closest sampled point on surface2 for every sample of surface1
+        closest, min_dist = _nearest_points(points1, points2)
+        
+        # If points are close enough, consider it an intersection
+        mask = min_dist < tolerance
+        if not mask.any():
             return None
+        
+        # Add midpoints as intersections
+        midpoints = (points1[mask] + points2[closest[mask]]) / 2
+        return {
+            'x': np.ascontiguousarray(midpoints[:, 0]),
+            'y': np.ascontiguousarray(midpoints[:, 1]),
+            'z': np.ascontiguousarray(midpoints[:, 2])
+        }
             
     except Exception as e:
         logger.warning(f"Error calculating surface intersections: {e}")
-        return None 
\ No newline at end of file
+        return None 
+
+
+def _nearest_points(
+    points1: np.ndarray, 
+    points2: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the nearest point of points2 for each point of points1.
+    
+    Uses one broadcast (n, m) squared-distance matrix; the subsampled
+    surface point clouds are small enough that no spatial index is needed.
+    
+    Args:
+        points1, points2: Point clouds of shape (n, 3) and (m, 3)
+        
+    Returns:
+        Tuple of (index into points2, distance) arrays of length n
+    """
+    diff = points1[:, np.newaxis, :] - points2[np.newaxis, :, :]
+    dist_sq = np.einsum('ijk,ijk->ij', diff, diff)
+    index = dist_sq.argmin(axis=1)
+    return index, np.sqrt(dist_sq[np.arange(len(points1)), index])
@@ -3,7 +3,15 @@ Mathematical utility functions for SKB Visualization Application.
 Contains helper functions for color conversion and other utilities.
 """
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+# Decimal places kept when quantizing surface parameters for cache keys
+TWIST_DECIMALS = 4
+TIME_DECIMALS = 4
+LOOP_DECIMALS = 3
 
 
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
@@ -23,9 +31,14 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         raise ValueError(f"Invalid hex color format: {hex_color}")
     
     try:
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        rgb = tuple(bytes.fromhex(hex_color))
     except ValueError as e:
         raise ValueError(f"Invalid hex color: {hex_color}") from e
+    
+    # bytes.fromhex skips whitespace, so six characters may decode to fewer bytes
+    if len(rgb) != 3:
+        raise ValueError(f"Invalid hex color: {hex_color}")
+    return rgb
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
@@ -51,4 +64,83 @@ def normalize_color(color: Tuple[int, int, int]) -> Tuple[float, float, float]:
     Returns:
         RGB tuple with values 0-1
     """
-    return tuple(c / 255.0 for c in color) 
\ No newline at end of file
+    return tuple(c / 255.0 for c in color) 
+
+
+def quantize_surface_parameters(
+    twists: Sequence[float],
+    time_param: float,
+    loop_factor: float
+) -> Tuple[Tuple[float, ...], float, float]:
+    """
+    Round surface parameters so near-identical frames share a cache entry.
+    
+    Args:
+        twists: Twist parameters [kx, ky, kz, kt]
+        time_param: Time parameter
+        loop_factor: Number of loops in the parametric domain
+        
+    Returns:
+        Tuple of (twists, time_param, loop_factor) as rounded Python floats
+    """
+    return (
+        tuple(round(float(k), TWIST_DECIMALS) for k in twists),
+        round(float(time_param), TIME_DECIMALS),
+        round(float(loop_factor), LOOP_DECIMALS)
+    )
+
+
+@lru_cache(maxsize=64)
+def cached_linspace(start: float, stop: float, num: int, dtype: type = np.float64) -> np.ndarray:
+    """
+    Memoized, read-only np.linspace for parameter axes reused across calls.
+    
+    Args:
+        start, stop: Interval endpoints
+        num: Number of samples
+        dtype: Output dtype
+        
+    Returns:
+        Read-only array of evenly spaced samples
+    """
+    samples = np.linspace(start, stop, num, dtype=dtype)
+    samples.flags.writeable = False
+    return samples
+
+
+def ctc_time_twist(u: np.ndarray, t: float, kt: float,
+                   amplitude: float, stability_gain: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Time twist modulation used by the surface generators for CTC visualization.
+    
+    Args:
+        u: Row vector of u parameters
+        t: Time parameter
+        kt: Time twist parameter
+        amplitude: Scale of the time modulation
+        stability_gain: How strongly |kt| damps the in-plane displacement
+        
+    Returns:
+        Tuple of (time_factor, twist) row vectors, where twist is the
+        stability-damped time factor applied along cos(v)/sin(v)
+    """
+    time_factor = kt * np.sin(u + t) * amplitude
+    stability_factor = 1.0 / (1.0 + abs(kt) * stability_gain)
+    return time_factor, time_factor * stability_factor
+
+
+def low_rank_grid(columns: Sequence[np.ndarray], rows: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Materialize a surface grid written as a sum of separable terms.
+    
+    Computes ``sum(c * r for c, r in zip(columns, rows))`` with a single
+    matmul instead of one full-grid temporary per term.
+    
+    Args:
+        columns: v-dependent factors, each of shape (rows, 1)
+        rows: u-dependent factors, each of shape (1, cols)
+        
+    Returns:
+        Grid of shape (rows, cols)
+    """
+    return np.hstack(columns) @ np.vstack(rows)
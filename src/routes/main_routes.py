@@ -3,9 +3,7 @@ Main navigation routes for SKB Visualization Application.
 Handles basic page routing and navigation.
 """
 
-import base64
-import os
-from flask import Blueprint, render_template, send_file
+from flask import Blueprint, render_template
 
 main_bp = Blueprint('main', __name__)
 
@@ -4,8 +4,8 @@ Contains business logic separated from routes and presentation layers.
 """
 
 from .evolution_service import EvolutionService
-from .topology_service import TopologyService
+from .topology_service import SKBParams, TopologyService
 from .visualization_service import VisualizationService
 
 # Export all services
-__all__ = ["EvolutionService", "TopologyService", "VisualizationService"] 
\ No newline at end of file
+__all__ = ["EvolutionService", "SKBParams", "TopologyService", "VisualizationService"] 
\ No newline at end of file
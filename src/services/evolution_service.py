@@ -3,14 +3,61 @@ Evolution Service for SKB Visualization Application.
 Handles evolutionary algorithm computations for finding compatible Sub-SKBs.
 """
 
-import random
 import logging
-from typing import Dict, List, Any, Tuple
+from dataclasses import dataclass, fields
+
+import numpy as np
+from typing import Dict, List, Any, NamedTuple
 
 from .topology_service import TopologyService
 
 logger = logging.getLogger(__name__)
 
+# Parameters exchanged by crossover and targeted by mutation
+_GENES = ('tx', 'ty', 'tz', 'tt', 'orientable', 'genus')
+
+# Upper bound (with float slack) on ||t_i + t_j||² for any compatible pair
+_MAX_TWIST_SUM_SQ = 1.25 + 1e-9
+
+
+@dataclass(slots=True)
+class SKBPopulation:
+    """Population of Sub-SKBs stored as one array per parameter."""
+    
+    tx: np.ndarray
+    ty: np.ndarray
+    tz: np.ndarray
+    tt: np.ndarray
+    orientable: np.ndarray
+    genus: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.tx)
+    
+    def individual(self, index: int) -> Dict[str, Any]:
+        """Parameters of one individual as plain (JSON-serializable) Python values."""
+        return {
+            'tx': float(self.tx[index]),
+            'ty': float(self.ty[index]),
+            'tz': float(self.tz[index]),
+            'tt': float(self.tt[index]),
+            'orientable': int(self.orientable[index]),
+            'genus': int(self.genus[index])
+        }
+    
+    def take(self, indices: np.ndarray) -> 'SKBPopulation':
+        """Gather the given individuals into a new population."""
+        return SKBPopulation(*(getattr(self, f.name)[indices] for f in fields(self)))
+
+
+class _PopulationFeatures(NamedTuple):
+    """Per-individual quantities shared by fitness and pair screening."""
+    
+    twists: np.ndarray  # (N, 4) rows of (tx, ty, tz, tt)
+    sq_norms: np.ndarray  # ||twist||² per individual
+    euler: np.ndarray  # Euler characteristic
+    positive_definite: np.ndarray  # Intersection form type (tx·ty > 0)
+
 
 class EvolutionService:
     """Service for evolutionary algorithm computations."""
@@ -42,8 +89,11 @@ class EvolutionService:
         # Target values
         targets = self._extract_targets(data)
         
+        # Per-run generator: shared services must not share RNG state across threads
+        rng = np.random.default_rng()
+        
         # Initialize population
-        population = self._initialize_population(population_size)
+        population = self._initialize_population(population_size, rng)
         
         # Track results
         best_individuals = []
@@ -51,25 +101,28 @@ class EvolutionService:
         
         # Run evolution
         for generation in range(generations):
+            # Derive topological features once for fitness and pair screening
+            features = self._population_features(population)
+            
             # Evaluate fitness
-            fitness_scores = self._evaluate_fitness(population, weights, targets)
+            fitness_scores = self._evaluate_fitness(population, weights, targets, features)
             
             # Track best individual
             best_idx = fitness_scores.index(max(fitness_scores))
             best_individuals.append({
                 'generation': generation,
-                'parameters': population[best_idx],
+                'parameters': population.individual(best_idx),
                 'fitness': fitness_scores[best_idx]
             })
             
             # Check for compatible pairs
             compatible_pairs.extend(
-                self._find_compatible_pairs(population, generation)
+                self._find_compatible_pairs(population, generation, features)
             )
             
             # Create new generation
             population = self._create_new_generation(
-                population, fitness_scores, population_size, mutation_rate
+                population, fitness_scores, population_size, mutation_rate, rng
             )
         
         logger.info(f"Evolution completed with {len(best_individuals)} generations")
@@ -97,142 +150,163 @@ class EvolutionService:
             'q_form': data.get('target_q_form', 'indefinite')
         }
     
-    def _initialize_population(self, population_size: int) -> List[Dict[str, float]]:
+    def _initialize_population(self, population_size: int, rng: np.random.Generator) -> SKBPopulation:
         """Initialize random population of Sub-SKBs."""
-        population = []
-        for _ in range(population_size):
-            skb = {
-                'tx': random.uniform(-5, 5),
-                'ty': random.uniform(-5, 5),
-                'tz': random.uniform(-5, 5),
-                'tt': random.uniform(-1, 1),  # Time twist parameter
-                'orientable': 1 if random.random() > 0.5 else 0,
-                'genus': random.randint(0, 3)
-            }
-            population.append(skb)
-        return population
+        return SKBPopulation(
+            tx=rng.uniform(-5, 5, population_size),
+            ty=rng.uniform(-5, 5, population_size),
+            tz=rng.uniform(-5, 5, population_size),
+            tt=rng.uniform(-1, 1, population_size),  # Time twist parameter
+            orientable=rng.integers(0, 2, population_size),
+            genus=rng.integers(0, 4, population_size)
+        )
+    
+    def _population_features(self, population: SKBPopulation) -> _PopulationFeatures:
+        """Compute the per-individual features used within one generation."""
+        twists = np.column_stack((population.tx, population.ty, population.tz, population.tt))
+        genus = population.genus
+        return _PopulationFeatures(
+            twists=twists,
+            sq_norms=np.einsum('ij,ij->i', twists, twists),
+            # Calculate Euler characteristic
+            euler=np.where(population.orientable == 1, 2 - 2 * genus, 2 - genus),
+            # Calculate intersection form type
+            positive_definite=population.tx * population.ty > 0
+        )
     
     def _evaluate_fitness(
         self, 
-        population: List[Dict[str, float]], 
+        population: SKBPopulation, 
         weights: Dict[str, float],
-        targets: Dict[str, Any]
+        targets: Dict[str, Any],
+        features: _PopulationFeatures
     ) -> List[float]:
         """Evaluate fitness for each individual in the population."""
-        fitness_scores = []
+        tx, ty, tz, tt = population.tx, population.ty, population.tz, population.tt
+        orientable = population.orientable
+        euler, positive_definite = features.euler, features.positive_definite
         
-        for skb in population:
-            # Calculate topological properties
-            orientable = skb['orientable']
-            genus = skb['genus']
-            
-            # Calculate Euler characteristic
-            euler = 2 - 2 * genus if orientable == 1 else 2 - genus
-            
-            # Calculate intersection form type
-            q_form = "Positive Definite" if skb['tx'] * skb['ty'] > 0 else "Indefinite"
-            
-            # Calculate fitness components
-            w1_fitness = 1.0 if (
-                (orientable == 1 and targets['orientability'] == 'orientable') or
-                (orientable == 0 and targets['orientability'] == 'non-orientable')
-            ) else 0.0
-            
-            euler_fitness = 1.0 / (1.0 + abs(euler - targets['euler']))
-            q_fitness = 1.0 if q_form == targets['q_form'] else 0.0
-            
-            # Twist alignment - prefer values that would cancel out when combined
-            twist_fitness = 1.0 / (1.0 + abs(skb['tx']) + abs(skb['ty']) + abs(skb['tz']))
-            
-            # CTC stability - prefer moderate time twist values
-            ctc_fitness = 1.0 - abs(skb['tt'])
-            
-            # Combined fitness with weights
-            fitness = (
-                weights['w1'] * w1_fitness +
-                weights['euler'] * euler_fitness +
-                weights['q'] * q_fitness +
-                weights['twist'] * twist_fitness +
-                weights['ctc'] * ctc_fitness
-            )
-            
-            fitness_scores.append(fitness)
+        # Calculate fitness components
+        target_orientable = {'orientable': 1, 'non-orientable': 0}.get(targets['orientability'])
+        w1_fitness = (orientable == target_orientable).astype(np.float64)
         
-        return fitness_scores
+        euler_fitness = 1.0 / (1.0 + np.abs(euler - targets['euler']))
+        if targets['q_form'] == "Positive Definite":
+            q_fitness = positive_definite.astype(np.float64)
+        elif targets['q_form'] == "Indefinite":
+            q_fitness = (~positive_definite).astype(np.float64)
+        else:
+            q_fitness = np.zeros_like(tx)
+        
+        # Twist alignment - prefer values that would cancel out when combined
+        twist_fitness = 1.0 / (1.0 + np.abs(tx) + np.abs(ty) + np.abs(tz))
+        
+        # CTC stability - prefer moderate time twist values
+        ctc_fitness = 1.0 - np.abs(tt)
+        
+        # Combined fitness with weights
+        fitness = (
+            weights['w1'] * w1_fitness +
+            weights['euler'] * euler_fitness +
+            weights['q'] * q_fitness +
+            weights['twist'] * twist_fitness +
+            weights['ctc'] * ctc_fitness
+        )
+        
+        return fitness.tolist()
     
     def _find_compatible_pairs(
         self, 
-        population: List[Dict[str, float]], 
-        generation: int
+        population: SKBPopulation, 
+        generation: int,
+        features: _PopulationFeatures
     ) -> List[Dict[str, Any]]:
         """Find compatible pairs in the current population."""
         compatible_pairs = []
         
-        for i in range(len(population)):
-            for j in range(i + 1, len(population)):
-                compatibility = self.topology_service.compute_compatibility_internal(
-                    population[i], population[j]
-                )
-                if compatibility.get('compatible', False):
-                    compatible_pairs.append({
-                        'generation': generation,
-                        'skb1': population[i],
-                        'skb2': population[j],
-                        'details': compatibility
-                    })
+        # Compatibility requires |Σ spatial twist|₁ < 1 and |Σ time twist| < 0.5,
+        # which implies ||t_i + t_j||² < 1.25 for the (tx, ty, tz, tt) vectors.
+        # ||a + b||² = ||a||² + ||b||² + 2a·b screens all pairs at once, together
+        # with the orientability and intersection form matches, so the full
+        # check only runs on pairs that can pass it.
+        twists, sq_norms = features.twists, features.sq_norms
+        sum_sq = sq_norms[:, np.newaxis] + sq_norms[np.newaxis, :] + 2.0 * (twists @ twists.T)
+        candidates = np.triu(sum_sq < _MAX_TWIST_SUM_SQ, k=1)
+        candidates &= population.orientable[:, np.newaxis] == population.orientable[np.newaxis, :]
+        candidates &= features.positive_definite[:, np.newaxis] == features.positive_definite[np.newaxis, :]
+        
+        pairs = np.argwhere(candidates)
+        individuals = {k: population.individual(k) for k in np.unique(pairs).tolist()}
+        for i, j in pairs.tolist():
+            skb1, skb2 = individuals[i], individuals[j]
+            compatibility = self.topology_service.compute_compatibility_internal(skb1, skb2)
+            if compatibility.get('compatible', False):
+                compatible_pairs.append({
+                    'generation': generation,
+                    'skb1': skb1,
+                    'skb2': skb2,
+                    'details': compatibility
+                })
         
         return compatible_pairs
     
     def _create_new_generation(
         self,
-        population: List[Dict[str, float]],
+        population: SKBPopulation,
         fitness_scores: List[float],
         population_size: int,
-        mutation_rate: float
-    ) -> List[Dict[str, float]]:
+        mutation_rate: float,
+        rng: np.random.Generator
+    ) -> SKBPopulation:
         """Create new generation through selection, crossover, and mutation."""
-        # Selection - tournament selection
-        new_population = []
+        # Selection - tournament selection, all tournaments drawn at once
         tournament_size = 3
+        tournaments = rng.integers(0, population_size, size=(population_size, tournament_size))
+        fitness = np.asarray(fitness_scores)
+        winners = tournaments[np.arange(population_size), np.argmax(fitness[tournaments], axis=1)]
+        new_population = population.take(winners)
         
-        for _ in range(population_size):
-            # Tournament selection
-            tournament = random.sample(range(population_size), tournament_size)
-            best_in_tournament = max(tournament, key=lambda idx: fitness_scores[idx])
-            new_population.append(population[best_in_tournament].copy())
-        
-        # Crossover and Mutation
-        for i in range(0, population_size, 2):
-            if i + 1 < population_size:
-                # Crossover
-                if random.random() < 0.7:  # 70% chance of crossover
-                    self._crossover(new_population[i], new_population[i + 1])
-                
-                # Mutation
-                for j in range(i, i + 2):
-                    if random.random() < mutation_rate:
-                        self._mutate(new_population[j])
+        # Individuals are paired (0, 1), (2, 3), ...; an odd one out is left untouched
+        paired = population_size - population_size % 2
+        
+        # Crossover - 70% chance per pair of swapping one random gene
+        first = np.arange(0, paired, 2)
+        crossing = rng.random(len(first)) < 0.7
+        self._crossover(new_population, first[crossing], rng.integers(0, len(_GENES), crossing.sum()))
+        
+        # Mutation
+        mutants = np.flatnonzero(rng.random(paired) < mutation_rate)
+        self._mutate(new_population, mutants, rng.integers(0, len(_GENES), len(mutants)), rng)
         
         return new_population
     
-    def _crossover(self, parent1: Dict[str, float], parent2: Dict[str, float]) -> None:
-        """Perform crossover between two parents."""
-        crossover_point = random.choice(['tx', 'ty', 'tz', 'tt', 'orientable', 'genus'])
-        parent1[crossover_point], parent2[crossover_point] = \
-            parent2[crossover_point], parent1[crossover_point]
-    
-    def _mutate(self, individual: Dict[str, float]) -> None:
-        """Mutate an individual."""
-        param = random.choice(['tx', 'ty', 'tz', 'tt', 'orientable', 'genus'])
-        
-        if param in ['tx', 'ty', 'tz']:
-            individual[param] += random.uniform(-1, 1)
-            individual[param] = max(-5, min(5, individual[param]))
-        elif param == 'tt':
-            individual[param] += random.uniform(-0.2, 0.2)
-            individual[param] = max(-1, min(1, individual[param]))
-        elif param == 'orientable':
-            individual[param] = 1 - individual[param]
-        elif param == 'genus':
-            individual[param] += random.choice([-1, 1])
-            individual[param] = max(0, min(3, individual[param])) 
\ No newline at end of file
+    def _crossover(self, population: SKBPopulation, first: np.ndarray, genes: np.ndarray) -> None:
+        """Swap one gene (an index into _GENES) between each parent ``first`` and its partner ``first + 1``."""
+        for g, name in enumerate(_GENES):
+            left = first[genes == g]
+            right = left + 1
+            values = getattr(population, name)
+            values[left], values[right] = values[right], values[left]
+    
+    def _mutate(
+        self,
+        population: SKBPopulation,
+        indices: np.ndarray,
+        genes: np.ndarray,
+        rng: np.random.Generator
+    ) -> None:
+        """Mutate one gene (an index into _GENES) of each individual in ``indices``."""
+        for g, param in enumerate(_GENES):
+            idx = indices[genes == g]
+            if not len(idx):
+                continue
+            values = getattr(population, param)
+            
+            if param in ['tx', 'ty', 'tz']:
+                values[idx] = np.clip(values[idx] + rng.uniform(-1, 1, len(idx)), -5, 5)
+            elif param == 'tt':
+                values[idx] = np.clip(values[idx] + rng.uniform(-0.2, 0.2, len(idx)), -1, 1)
+            elif param == 'orientable':
+                values[idx] = 1 - values[idx]
+            elif param == 'genus':
+                values[idx] = np.clip(values[idx] + rng.choice((-1, 1), len(idx)), 0, 3)
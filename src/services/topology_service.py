@@ -4,10 +4,73 @@ Handles topological compatibility computations between Sub-SKBs.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Dict, Any, Mapping, Sequence, Tuple, Union
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Bit layout of compute_compatibility_flags, in _compatibility_checks order
+COMPAT_W1 = 1 << 0
+COMPAT_TWIST = 1 << 1
+COMPAT_KS = 1 << 2
+COMPAT_Q = 1 << 3
+COMPAT_CTC = 1 << 4
+COMPAT_ALL = COMPAT_W1 | COMPAT_TWIST | COMPAT_KS | COMPAT_Q | COMPAT_CTC
+
+
+@dataclass(slots=True, frozen=True, order=True)
+class SKBParams:
+    """Validated Sub-SKB parameters (hashable, so usable as a cache key)."""
+    
+    tx: float = 0.0
+    ty: float = 0.0
+    tz: float = 0.0
+    tt: float = 0.0
+    orientable: int = 1
+    genus: int = 0
+    
+    @classmethod
+    def from_dict(cls, skb: Dict[str, Any]) -> 'SKBParams':
+        """
+        Build parameters from a request dict, converting each value.
+        
+        Args:
+            skb: Sub-SKB parameters keyed by field name; missing keys use defaults
+            
+        Returns:
+            SKBParams instance
+            
+        Raises:
+            ValueError, TypeError: If a value cannot be converted
+        """
+        return cls(
+            float(skb.get('tx', 0)),
+            float(skb.get('ty', 0)),
+            float(skb.get('tz', 0)),
+            float(skb.get('tt', 0)),
+            int(skb.get('orientable', 1)),
+            int(skb.get('genus', 0))
+        )
+    
+    def as_tuple(self) -> Tuple[float, float, float, float, int, int]:
+        """Parameters in (tx, ty, tz, tt, orientable, genus) order."""
+        return (self.tx, self.ty, self.tz, self.tt, self.orientable, self.genus)
+
+
+# Field order and defaults shared by SKBParams and the (N, 6) batch layout
+_SKB_FIELDS = tuple(field.name for field in fields(SKBParams))
+_SKB_DEFAULTS = SKBParams().as_tuple()
+
+# A single Sub-SKB: an SKBParams instance, or a request dict keyed by field name
+SKBLike = Union[SKBParams, Dict[str, Any]]
+
+# Batches of Sub-SKBs: a sequence of single Sub-SKBs, or a structure of arrays
+# mapping each field name to a 1-D column (missing fields use defaults)
+SKBBatch = Union[Sequence[SKBLike], Mapping[str, Any]]
+
 
 class TopologyService:
     """Service for topological computations."""
@@ -29,15 +92,15 @@ class TopologyService:
     
     def compute_compatibility_internal(
         self, 
-        skb1: Dict[str, Any], 
-        skb2: Dict[str, Any]
+        skb1: SKBLike, 
+        skb2: SKBLike
     ) -> Dict[str, Any]:
         """
         Internal method to compute topological compatibility between two Sub-SKBs.
         
         Args:
-            skb1: First Sub-SKB parameters
-            skb2: Second Sub-SKB parameters
+            skb1: First Sub-SKB parameters, as SKBParams or a dict
+            skb2: Second Sub-SKB parameters, as SKBParams or a dict
             
         Returns:
             Dict containing detailed compatibility analysis
@@ -47,18 +110,18 @@ class TopologyService:
             params1 = self._extract_skb_parameters(skb1)
             params2 = self._extract_skb_parameters(skb2)
             
-            # Compute compatibility components
-            w1_compatible = self._compute_stiefel_whitney_compatibility(params1, params2)
-            twist_compatible = self._compute_twist_compatibility(params1, params2)
-            ctc_stable = self._compute_ctc_stability(params1, params2)
-            ks_compatible = self._compute_kirby_siebenmann_compatibility(params1, params2)
-            q_compatible = self._compute_intersection_form_compatibility(params1, params2)
+            # Compute compatibility components; every check is symmetric, so
+            # order the pair to share one cache entry for (a, b) and (b, a)
+            w1_compatible, twist_compatible, ks_compatible, q_compatible, ctc_stable = (
+                _cached_compatibility(*sorted((params1, params2)))
+            )
             
-            # Overall compatibility
-            compatible = all([
-                w1_compatible, twist_compatible, ks_compatible, 
-                q_compatible, ctc_stable
-            ])
+            # Overall compatibility; bitwise & on bools evaluates every check
+            # without building a list or short-circuiting
+            compatible = (
+                w1_compatible & twist_compatible & ks_compatible
+                & q_compatible & ctc_stable
+            )
             
             # Detailed compatibility report
             compatibility_details = {
@@ -70,70 +133,150 @@ class TopologyService:
                 "compatible": compatible
             }
             
-            logger.debug(f"Computed compatibility: {compatible}")
+            logger.debug("Computed compatibility: %s", compatible)
             return compatibility_details
             
         except (ValueError, TypeError) as e:
             logger.error(f"Error in topology computation: {e}")
             return {"error": str(e), "compatible": False}
     
-    def _extract_skb_parameters(self, skb: Dict[str, Any]) -> Dict[str, float]:
-        """Extract and validate SKB parameters."""
-        return {
-            'tx': float(skb.get('tx', 0)),
-            'ty': float(skb.get('ty', 0)),
-            'tz': float(skb.get('tz', 0)),
-            'tt': float(skb.get('tt', 0)),
-            'orientable': int(skb.get('orientable', 1)),
-            'genus': int(skb.get('genus', 0))
-        }
-    
-    def _compute_stiefel_whitney_compatibility(
+    def compute_compatibility_batch(
         self, 
-        params1: Dict[str, float], 
-        params2: Dict[str, float]
-    ) -> bool:
-        """Compute Stiefel-Whitney class compatibility."""
-        return params1['orientable'] == params2['orientable']
+        skbs_a: SKBBatch, 
+        skbs_b: SKBBatch
+    ) -> np.ndarray:
+        """
+        Compute overall compatibility for every pairing of two Sub-SKB lists.
+        
+        Args:
+            skbs_a: First batch of Sub-SKB parameters (N entries), as a list
+                of SKBParams or dicts, or a mapping of field name to array
+            skbs_b: Second batch of Sub-SKB parameters (M entries)
+            
+        Returns:
+            Boolean array of shape (N, M); entry [i, j] is the ``compatible``
+            result of compute_compatibility_internal(skbs_a[i], skbs_b[j])
+            
+        Raises:
+            ValueError: If any parameter cannot be converted to a number
+        """
+        return self.compute_compatibility_flags(skbs_a, skbs_b) == COMPAT_ALL
     
-    def _compute_twist_compatibility(
+    def compute_compatibility_flags(
         self, 
-        params1: Dict[str, float], 
-        params2: Dict[str, float]
-    ) -> bool:
-        """Compute twist parameter compatibility."""
-        twist_sum = (
-            abs(params1['tx'] + params2['tx']) + 
-            abs(params1['ty'] + params2['ty']) + 
-            abs(params1['tz'] + params2['tz'])
-        )
-        return twist_sum < 1.0
+        skbs_a: SKBBatch, 
+        skbs_b: SKBBatch
+    ) -> np.ndarray:
+        """
+        Compute the individual compatibility checks for every pairing, bit-packed.
+        
+        Args:
+            skbs_a: First batch of Sub-SKB parameters (N entries), as a list
+                of SKBParams or dicts, or a mapping of field name to array
+            skbs_b: Second batch of Sub-SKB parameters (M entries)
+            
+        Returns:
+            uint8 array of shape (N, M) with the COMPAT_W1, COMPAT_TWIST,
+            COMPAT_KS, COMPAT_Q and COMPAT_CTC bits set for passing checks;
+            a pair is compatible when all bits are set (``== COMPAT_ALL``)
+            
+        Raises:
+            ValueError: If any parameter cannot be converted to a number
+        """
+        params_a = self._stack_skb_parameters(skbs_a)
+        params_b = self._stack_skb_parameters(skbs_b)
+        
+        checks = _compatibility_checks(params_a[:, np.newaxis, :], params_b[np.newaxis, :, :])
+        flags = np.zeros((len(params_a), len(params_b)), dtype=np.uint8)
+        for bit, check in enumerate(checks):
+            flags |= check.astype(np.uint8) << bit
+        return flags
     
-    def _compute_ctc_stability(
-        self, 
-        params1: Dict[str, float], 
-        params2: Dict[str, float]
-    ) -> bool:
-        """Compute Closed Timelike Curve stability."""
-        time_twist_sum = abs(params1['tt'] + params2['tt'])
-        return time_twist_sum < 0.5
-    
-    def _compute_kirby_siebenmann_compatibility(
-        self, 
-        params1: Dict[str, float], 
-        params2: Dict[str, float]
-    ) -> bool:
-        """Compute Kirby-Siebenmann invariant compatibility."""
-        ks1 = (params1['tx'] * params1['ty'] * params1['tz']) % 2
-        ks2 = (params2['tx'] * params2['ty'] * params2['tz']) % 2
-        return ks1 == ks2
-    
-    def _compute_intersection_form_compatibility(
-        self, 
-        params1: Dict[str, float], 
-        params2: Dict[str, float]
-    ) -> bool:
-        """Compute intersection form type compatibility."""
-        q_form_1 = "Positive Definite" if params1['tx'] * params1['ty'] > 0 else "Indefinite"
-        q_form_2 = "Positive Definite" if params2['tx'] * params2['ty'] > 0 else "Indefinite"
-        return q_form_1 == q_form_2 
\ No newline at end of file
+    def _stack_skb_parameters(self, skbs: SKBBatch) -> np.ndarray:
+        """
+        Extract parameters of several Sub-SKBs into an (N, 6) array.
+        
+        Args:
+            skbs: List of SKBParams or Sub-SKB dicts, or a mapping of field name to a
+                scalar or 1-D column, which is used without per-SKB work
+            
+        Returns:
+            float64 array whose columns are (tx, ty, tz, tt, orientable, genus)
+            
+        Raises:
+            ValueError: If a value cannot be converted or columns differ in length
+        """
+        if isinstance(skbs, Mapping):
+            columns = np.broadcast_arrays(*(
+                np.atleast_1d(np.asarray(skbs.get(name, default), dtype=np.float64))
+                for name, default in zip(_SKB_FIELDS, _SKB_DEFAULTS)
+            ))
+            params = np.stack(columns, axis=-1)
+            if params.ndim != 2:
+                raise ValueError("Sub-SKB parameter columns must be one-dimensional")
+            # orientable and genus are integers, truncated like int() does
+            params[:, 4:] = np.trunc(params[:, 4:])
+            return params
+        
+        params = [self._extract_skb_parameters(skb).as_tuple() for skb in skbs]
+        return np.array(params, dtype=np.float64).reshape(len(params), 6)
+    
+    def _extract_skb_parameters(self, skb: SKBLike) -> SKBParams:
+        """Extract and validate SKB parameters; SKBParams pass through as-is."""
+        if isinstance(skb, SKBParams):
+            return skb
+        return SKBParams.from_dict(skb)
+
+
+@lru_cache(maxsize=4096)
+def _cached_compatibility(
+    params1: SKBParams, 
+    params2: SKBParams
+) -> Tuple[bool, bool, bool, bool, bool]:
+    """Memoized (w1, twist, ks, q, ctc) checks for one pair of Sub-SKBs."""
+    checks = _compatibility_checks(
+        np.array(params1.as_tuple(), dtype=np.float64),
+        np.array(params2.as_tuple(), dtype=np.float64)
+    )
+    return tuple(bool(check) for check in checks)
+
+
+def _compatibility_checks(
+    params1: np.ndarray, 
+    params2: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate all topological compatibility checks between Sub-SKBs.
+    
+    Works elementwise over any leading axes, so a single pair and broadcast
+    batches of pairs share the same code.
+    
+    Args:
+        params1, params2: Parameter arrays whose last axis is
+            (tx, ty, tz, tt, orientable, genus)
+        
+    Returns:
+        Tuple of boolean arrays (w1, twist, ks, q, ctc)
+    """
+    combined = params1 + params2
+    tx1, ty1, tz1, orientable1 = params1[..., 0], params1[..., 1], params1[..., 2], params1[..., 4]
+    tx2, ty2, tz2, orientable2 = params2[..., 0], params2[..., 1], params2[..., 2], params2[..., 4]
+    
+    # Stiefel-Whitney class compatibility
+    w1_compatible = orientable1 == orientable2
+    
+    # Twist parameter compatibility
+    twist_compatible = (
+        np.abs(combined[..., 0]) + np.abs(combined[..., 1]) + np.abs(combined[..., 2])
+    ) < 1.0
+    
+    # Kirby-Siebenmann invariant compatibility
+    ks_compatible = (tx1 * ty1 * tz1) % 2 == (tx2 * ty2 * tz2) % 2
+    
+    # Intersection form type compatibility (positive definite vs indefinite)
+    q_compatible = (tx1 * ty1 > 0) == (tx2 * ty2 > 0)
+    
+    # Closed Timelike Curve stability
+    ctc_stable = np.abs(combined[..., 3]) < 0.5
+    
+    return w1_compatible, twist_compatible, ks_compatible, q_compatible, ctc_stable
@@ -6,7 +6,8 @@ Handles generation of complex 3D visualizations and surface rendering.
 import numpy as np
 import logging
 import traceback
-from typing import Dict, Any, List, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple
 
 from ..mathematics import (
     generate_klein_bottle,
@@ -19,9 +20,128 @@ from ..mathematics import (
     generate_topological_field_lines,
     calculate_surface_intersections
 )
+from ..mathematics.utils import quantize_surface_parameters
+from ..utils.cache import cached_mobius_strip, cached_torus
 
 logger = logging.getLogger(__name__)
 
+# Different weights for the three Sub-SKB components of a merged SKB
+_MERGE_WEIGHTS = np.array([0.4, 0.35, 0.25])
+_MERGE_WEIGHTS.flags.writeable = False
+
+# Request keys of the twist parameters: t{i}x, t{i}y, t{i}z, t{i}t per Sub-SKB
+_TWIST_KEYS = tuple(tuple(f't{i}{axis}' for axis in 'xyzt') for i in range(1, 4))
+
+# Valid twist ranges per (x, y, z, time) component
+_TWIST_LOWER = np.array([-5.0, -5.0, -5.0, -1.0])
+_TWIST_UPPER = np.array([5.0, 5.0, 5.0, 1.0])
+_TWIST_LOWER.flags.writeable = False
+_TWIST_UPPER.flags.writeable = False
+
+# Static part of the intersection marker traces (the marker is a shared,
+# read-only view)
+_INTERSECTION_TEMPLATE = {
+    'mode': 'markers',
+    'type': 'scatter3d',
+    'marker': MappingProxyType({
+        'size': 4,
+        'color': 'rgba(255, 255, 100, 0.9)',
+        'symbol': 'diamond',
+        'line': MappingProxyType({
+            'width': 2,
+            'color': 'rgba(255, 255, 255, 0.8)'
+        })
+    }),
+    'hoverinfo': 'name',
+    'showlegend': True
+}
+
+# Specialized lighting for each surface type, shared by every trace as
+# read-only views
+_LIGHTING_BY_SURFACE_TYPE = {
+    "Klein": MappingProxyType({
+        'ambient': 0.45,
+        'diffuse': 0.85,
+        'roughness': 0.25,
+        'specular': 0.95,
+        'fresnel': 0.6
+    }),
+    "Mobius": MappingProxyType({
+        'ambient': 0.5,
+        'diffuse': 0.75,
+        'roughness': 0.3,
+        'specular': 0.8,
+        'fresnel': 0.4
+    }),
+    "Torus": MappingProxyType({
+        'ambient': 0.55,
+        'diffuse': 0.7,
+        'roughness': 0.35,
+        'specular': 0.75,
+        'fresnel': 0.35
+    })
+}
+
+
+def _read_only(arrays: Tuple[np.ndarray, ...]) -> Tuple[np.ndarray, ...]:
+    """Mark surface arrays read-only, since cached geometry is shared between requests."""
+    for array in arrays:
+        array.flags.writeable = False
+    return tuple(arrays)
+
+
+@cached_mobius_strip()
+def _mobius_strip_geometry(
+    twist: Tuple[float, ...], 
+    t: float, 
+    loop_val: float, 
+    resolution: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Generate the (x, y, z, u, v) arrays of an enhanced twisted strip."""
+    return _read_only(generate_mobius_strip(list(twist), t, loop_val, resolution=resolution))
+
+
+@cached_torus()
+def _torus_geometry(
+    twist: Tuple[float, ...], 
+    t: float, 
+    loop_val: float, 
+    resolution: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Generate the (x, y, z, u, v) arrays of an enhanced torus."""
+    return _read_only(generate_torus(list(twist), t, loop_val, resolution=resolution))
+
+
+def _surface_geometry(
+    surface_type: int, 
+    twist: Tuple[float, ...], 
+    t: float, 
+    loop_val: float, 
+    resolution: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the geometry of one Sub-SKB surface through the application cache.
+    
+    Args:
+        surface_type: 0 for the Klein bottle, 1 for the twisted strip, 2 for the torus
+        twist: Quantized twist parameters
+        t: Quantized time parameter
+        loop_val: Quantized loop factor
+        resolution: Surface resolution
+        
+    Returns:
+        Tuple of (x, y, z, u, v) arrays, read-only when shared between requests
+    """
+    if surface_type == 0:
+        # Enhanced Klein bottle for first sub-SKB (cached by its generator)
+        result = generate_klein_bottle(twist, t, loop_val, resolution=resolution)
+        return _read_only((result['x'], result['y'], result['z'], result['u'], result['v']))
+    if surface_type == 1:
+        # Enhanced twisted strip (Möbius-like) for second sub-SKB
+        return _mobius_strip_geometry(twist, t, loop_val, resolution)
+    # Enhanced torus for third sub-SKB
+    return _torus_geometry(twist, t, loop_val, resolution)
+
 
 class VisualizationService:
     """Service for generating complex 3D visualizations."""
@@ -38,14 +158,11 @@ class VisualizationService:
         """
         try:
             logger.info("Received enhanced visualization request")
-            logger.debug(f"Request data: {data}")
+            logger.debug("Request data: %s", data)
             
             # Extract and validate parameters
             params = self._extract_parameters(data)
             
-            # Validate twist parameters
-            params['twists'] = self._validate_twists(params['twists'])
-            
             logger.info("Generating enhanced visualization data...")
             
             # Process colors
@@ -81,29 +198,26 @@ class VisualizationService:
         """Extract and validate visualization parameters."""
         # Basic parameters
         t = float(data.get('t', 0))
-        loop_factor = float(data.get('loop_factor', 1))
-        loop1 = float(data.get('loop1', 1))
-        loop2 = float(data.get('loop2', 1))
-        loop3 = float(data.get('loop3', 1))
+        # float() rejects null and other non-numeric values, which a direct
+        # np.array conversion would silently turn into NaN
+        loops = np.array([
+            float(data.get('loop_factor', 1)),
+            float(data.get('loop1', 1)),
+            float(data.get('loop2', 1)),
+            float(data.get('loop3', 1))
+        ])
         merge = bool(data.get('merge', False))
         
-        # Extract twist parameters for each sub-SKB
-        twists = []
-        for i in range(1, 4):
-            twist = [
-                float(data.get(f't{i}x', 0)),
-                float(data.get(f't{i}y', 0)),
-                float(data.get(f't{i}z', 0)),
-                float(data.get(f't{i}t', 0))  # Time twist parameter
-            ]
-            twists.append(twist)
+        # Extract twist parameters for each sub-SKB as rows of (x, y, z, time)
+        twists = np.array([
+            [float(data.get(key, 0)) for key in keys] for keys in _TWIST_KEYS
+        ])
         
-        # Ensure values are within scientifically valid ranges
+        # Ensure values are within scientifically valid ranges: spatial twists
+        # in [-5, 5], the time twist (critical for CTC stability) in [-1, 1]
+        np.clip(twists, _TWIST_LOWER, _TWIST_UPPER, out=twists)
         t = max(0, min(2 * np.pi, t))
-        loop_factor = max(1, min(5, loop_factor))
-        loop1 = max(1, min(5, loop1))
-        loop2 = max(1, min(5, loop2))
-        loop3 = max(1, min(5, loop3))
+        loop_factor, loop1, loop2, loop3 = np.clip(loops, 1, 5).tolist()
         
         # Color processing
         default_colors = {
@@ -118,32 +232,10 @@ class VisualizationService:
             'loop_factor': loop_factor,
             'loops': [loop1, loop2, loop3],
             'merge': merge,
-            'twists': twists,
+            'twists': twists.tolist(),
             'colors': colors
         }
     
-    def _validate_twists(self, twists: List[List[float]]) -> List[List[float]]:
-        """Validate twist parameters."""
-        validated_twists = []
-        for twist in twists:
-            validated_twist = []
-            # Validate spatial twist parameters (indices 0-2)
-            for j in range(3):
-                if j < len(twist):
-                    validated_twist.append(max(-5, min(5, twist[j])))
-                else:
-                    validated_twist.append(0.0)
-            
-            # Validate time twist parameter (index 3) - critical for CTC stability
-            if len(twist) > 3:
-                validated_twist.append(max(-1, min(1, twist[3])))
-            else:
-                validated_twist.append(0.0)
-            
-            validated_twists.append(validated_twist)
-        
-        return validated_twists
-    
     def _process_colors(self, colors: Dict[str, str]) -> Dict[str, Tuple[int, int, int]]:
         """Convert hex colors to RGB tuples."""
         color_rgb = {}
@@ -179,15 +271,11 @@ class VisualizationService:
         logger.debug("Generating enhanced merged SKB")
         
         # Enhanced merged stable SKB with weighted averages
-        weight_factors = [0.4, 0.35, 0.25]  # Different weights for different components
-        avg_twists = []
-        for j in range(4):
-            weighted_sum = sum(weight_factors[i] * params['twists'][i][j] for i in range(3))
-            avg_twists.append(weighted_sum)
+        avg_twists = _MERGE_WEIGHTS @ np.asarray(params['twists'], dtype=np.float64)
         
         # Generate enhanced Klein bottle for merged state
         result = generate_klein_bottle(
-            tuple(avg_twists), 
+            tuple(avg_twists.tolist()), 
             params['t'], 
             params['loop_factor'], 
             resolution=85
@@ -240,14 +328,14 @@ class VisualizationService:
         
         # Generate each enhanced sub-SKB
         for i, (twist, loop_val) in enumerate(zip(params['twists'], params['loops'])):
-            logger.debug(f"Generating enhanced Sub-SKB {i+1}")
+            logger.debug("Generating enhanced Sub-SKB %d", i + 1)
             
             # Generate surface based on type
             surface_data = self._generate_surface_by_type(i, twist, params['t'], loop_val)
             
             if surface_data:
                 x, y, z, u, v = surface_data
-                logger.debug(f"Enhanced Sub-SKB {i+1} generated, shape: {x.shape}")
+                logger.debug("Enhanced Sub-SKB %d generated, shape: %s", i + 1, x.shape)
                 
                 # Create enhanced surface trace
                 color_key = f'skb{i+1}'
@@ -290,66 +378,28 @@ class VisualizationService:
         loop_val: float
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Generate surface based on its type."""
-        if surface_index == 0:
-            # Enhanced Klein bottle for first sub-SKB
-            result = generate_klein_bottle(tuple(twist), t, loop_val, resolution=80)
-            return result['x'], result['y'], result['z'], result['u'], result['v']
-        elif surface_index == 1:
-            # Enhanced twisted strip (Möbius-like) for second sub-SKB
-            return generate_mobius_strip(twist, t, loop_val, resolution=80)
-        else:
-            # Enhanced torus for third sub-SKB
-            return generate_torus(twist, t, loop_val, resolution=80)
+        # Quantize parameters so near-identical frames (e.g. slider scrubbing)
+        # reuse the cached geometry
+        return _surface_geometry(
+            min(surface_index, 2),
+            *quantize_surface_parameters(twist, t, loop_val),
+            resolution=80
+        )
     
-    def _get_lighting_for_surface_type(self, surface_type: str) -> Dict[str, float]:
-        """Get specialized lighting for each surface type."""
-        lighting_configs = {
-            "Klein": {
-                'ambient': 0.45,
-                'diffuse': 0.85,
-                'roughness': 0.25,
-                'specular': 0.95,
-                'fresnel': 0.6
-            },
-            "Mobius": {
-                'ambient': 0.5,
-                'diffuse': 0.75,
-                'roughness': 0.3,
-                'specular': 0.8,
-                'fresnel': 0.4
-            },
-            "Torus": {
-                'ambient': 0.55,
-                'diffuse': 0.7,
-                'roughness': 0.35,
-                'specular': 0.75,
-                'fresnel': 0.35
-            }
-        }
-        return lighting_configs.get(surface_type, lighting_configs["Klein"])
+    def _get_lighting_for_surface_type(self, surface_type: str) -> Mapping[str, float]:
+        """Get specialized lighting for each surface type (a shared, read-only view)."""
+        return _LIGHTING_BY_SURFACE_TYPE.get(surface_type, _LIGHTING_BY_SURFACE_TYPE["Klein"])
     
     def _create_intersection_trace(
         self, 
-        intersection_points: Dict[str, List[float]], 
+        intersection_points: Dict[str, np.ndarray], 
         surface_index: int
     ) -> Dict[str, Any]:
         """Create intersection markers trace."""
         return {
+            **_INTERSECTION_TEMPLATE,
             'x': intersection_points['x'],
             'y': intersection_points['y'],
             'z': intersection_points['z'],
-            'mode': 'markers',
-            'type': 'scatter3d',
-            'marker': {
-                'size': 4,
-                'color': 'rgba(255, 255, 100, 0.9)',
-                'symbol': 'diamond',
-                'line': {
-                    'width': 2,
-                    'color': 'rgba(255, 255, 255, 0.8)'
-                }
-            },
-            'name': f'Topological Interface {surface_index}',
-            'hoverinfo': 'name',
-            'showlegend': True
-        } 
\ No newline at end of file
+            'name': f'Topological Interface {surface_index}'
+        }
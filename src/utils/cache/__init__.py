@@ -3,7 +3,7 @@ Caching utilities package for SKB Visualization Application.
 Provides memory and Redis-based caching for expensive computations.
 """
 
-from .backends import MemoryCache, RedisCache, CacheBackend
+from .backends import MemoryCache, StripedMemoryCache, RedisCache, TieredCache, CacheBackend
 from .manager import CacheManager, create_cache_manager
 from .decorators import (
     cached_klein_bottle,
@@ -18,7 +18,9 @@ __all__ = [
     # Backends
     "CacheBackend",
     "MemoryCache", 
+    "StripedMemoryCache",
     "RedisCache",
+    "TieredCache",
     
     # Manager
     "CacheManager",
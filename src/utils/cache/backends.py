@@ -3,14 +3,159 @@ Cache backend implementations for SKB Visualization Application.
 Provides memory and Redis-based cache backends.
 """
 
+import heapq
+import itertools
+import math
 import pickle
+import struct
+import threading
 import time
 import logging
-from typing import Any, Optional, Dict
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
+import orjson
+import redis
+import zstandard
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
+
+try:
+    import hiredis  # noqa: F401
+    _REDIS_PARSER = "hiredis"
+except ImportError:  # hiredis is optional; redis-py uses its Python parser
+    _REDIS_PARSER = "python"
+
 logger = logging.getLogger(__name__)
 
+# Serialized payloads start with a one-byte tag identifying the format
+_TAG_JSON = b"J"
+_TAG_PICKLE = b"P"
+_TAG_ZSTD = b"Z"
+
+# Payloads larger than this are zstd-compressed
+_COMPRESS_THRESHOLD = 32 * 1024
+_ZSTD_LEVEL = 3
+
+# zstd contexts are not safe to share between threads
+_zstd_local = threading.local()
+
+
+def _is_json_exact(value: Any) -> bool:
+    """
+    Check whether a value survives a JSON round trip unchanged.
+    
+    Only plain dicts with string keys, lists, strings, finite floats,
+    ints, bools and None qualify; tuples, arrays and NaN would come back
+    as a different type or value.
+    
+    Args:
+        value: Value to check
+        
+    Returns:
+        bool: True if the value can be stored as JSON
+    """
+    if value is None or type(value) in (str, int, bool):
+        return True
+    if type(value) is float:
+        return math.isfinite(value)
+    if type(value) is list:
+        return all(_is_json_exact(item) for item in value)
+    if type(value) is dict:
+        return all(
+            type(key) is str and _is_json_exact(item) for key, item in value.items()
+        )
+    return False
+
+
+def _zstd_compressor() -> "zstandard.ZstdCompressor":
+    """Get this thread's zstd compressor."""
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    return compressor
+
+
+def _zstd_decompressor() -> "zstandard.ZstdDecompressor":
+    """Get this thread's zstd decompressor."""
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor
+
+
+def _serialize(value: Any) -> bytes:
+    """
+    Serialize a value for an out-of-process cache.
+    
+    Plain JSON values are encoded with orjson.
+    Everything else uses pickle protocol 5 with out-of-band buffers so
+    large numpy arrays are written straight into the final payload instead
+    of being copied into the pickle stream first. Large payloads are then
+    zstd-compressed.
+    
+    Args:
+        value: Value to serialize
+        
+    Returns:
+        bytes: Payload prefixed with a format tag
+    """
+    data = _encode(value)
+    if len(data) > _COMPRESS_THRESHOLD:
+        return _TAG_ZSTD + _zstd_compressor().compress(data)
+    return data
+
+
+def _encode(value: Any) -> bytes:
+    """Encode a value as a tagged JSON or pickle payload."""
+    if _is_json_exact(value):
+        try:
+            return _TAG_JSON + orjson.dumps(value)
+        except TypeError:
+            # e.g. integers outside the 64-bit range
+            pass
+    
+    buffers = []
+    header = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+    lengths = [len(header)] + [raw.nbytes for raw in raws]
+    frame = struct.pack(f"<I{len(lengths)}Q", len(raws), *lengths)
+    return b"".join([_TAG_PICKLE, frame, header, *raws])
+
+
+def _deserialize(data: bytes) -> Any:
+    """
+    Deserialize a payload produced by ``_serialize``.
+    
+    Args:
+        data: Tagged payload
+        
+    Returns:
+        Any: Deserialized value
+    """
+    tag = data[:1]
+    if tag == _TAG_ZSTD:
+        data = _zstd_decompressor().decompress(memoryview(data)[1:])
+        tag = data[:1]
+    
+    if tag == _TAG_JSON:
+        return orjson.loads(memoryview(data)[1:])
+    if tag != _TAG_PICKLE:
+        raise ValueError("Unknown cache payload format")
+    
+    # Copy once into a writable buffer so restored arrays are not read-only
+    view = memoryview(bytearray(data))
+    (count,) = struct.unpack_from("<I", view, 1)
+    lengths = struct.unpack_from(f"<{count + 1}Q", view, 5)
+    offset = 5 + 8 * (count + 1)
+    
+    chunks = []
+    for length in lengths:
+        chunks.append(view[offset:offset + length])
+        offset += length
+    return pickle.loads(chunks[0], buffers=chunks[1:])
+
 
 class CacheBackend(ABC):
     """Abstract base class for cache backends."""
@@ -39,88 +184,240 @@ class CacheBackend(ABC):
     def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         pass
+    
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """Get several values from cache, in the order of ``keys``."""
+        return [self.get(key) for key in keys]
+    
+    def get_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """
+        Get a value together with its remaining time to live.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Tuple of (value, remaining seconds); the remaining time is None
+            when the entry does not expire or the backend cannot tell
+        """
+        return self.get(key), None
+    
+    def get_many_with_ttl(self, keys: Iterable[str]) -> List[Tuple[Optional[Any], Optional[float]]]:
+        """Get several values with their remaining TTLs, in the order of ``keys``."""
+        return [self.get_with_ttl(key) for key in keys]
+    
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set several values in cache with a shared optional TTL."""
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
+
+# Count-min sketch layout for the TinyLFU admission policy
+_SKETCH_SEEDS = (0x9E3779B9, 0x85EBCA6B, 0xC2B2AE35, 0x27D4EB2F)
+_SKETCH_MULTIPLIER = 0x9E3779B97F4A7C15
+_SKETCH_MAX_COUNT = 15
+_HALVE_COUNTERS = bytes(count >> 1 for count in range(256))
+
+_MEMORY_CACHE_POLICIES = ("lru", "tinylfu")
+
+
+class _FrequencySketch:
+    """Count-min sketch of 4-bit access counters with periodic aging."""
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize frequency sketch.
+        
+        Args:
+            capacity: Number of entries the owning cache can hold
+        """
+        self._width = max(16, 10 * capacity)
+        self._table = bytearray(len(_SKETCH_SEEDS) * self._width)
+        self._sample_size = 10 * max(1, capacity)
+        self._additions = 0
+    
+    def _indexes(self, key: Hashable):
+        """Yield one counter index per sketch row."""
+        h = hash(key)
+        width = self._width
+        for row, seed in enumerate(_SKETCH_SEEDS):
+            yield row * width + (((h ^ seed) * _SKETCH_MULTIPLIER) >> 32) % width
+    
+    def increment(self, key: Hashable) -> None:
+        """Record an access to ``key``, aging all counters periodically."""
+        table = self._table
+        for index in self._indexes(key):
+            if table[index] < _SKETCH_MAX_COUNT:
+                table[index] += 1
+        
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            # Halve every counter so old popularity fades out
+            self._table = table.translate(_HALVE_COUNTERS)
+            self._additions //= 2
+    
+    def estimate(self, key: Hashable) -> int:
+        """Estimate how often ``key`` was accessed recently."""
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
 
 
 class MemoryCache(CacheBackend):
-    """In-memory cache implementation with LRU eviction."""
+    """Thread-safe in-memory cache implementation with LRU eviction."""
     
-    def __init__(self, max_size: int = 1000, default_ttl: int = 3600):
+    def __init__(self, max_size: int = 1000, default_ttl: int = 3600, policy: str = "lru"):
         """
         Initialize memory cache.
         
         Args:
             max_size: Maximum number of items in cache
             default_ttl: Default TTL in seconds
+            policy: "lru", or "tinylfu" to only admit new keys when a full
+                cache has seen them at least as often as the LRU victim
         """
+        if policy not in _MEMORY_CACHE_POLICIES:
+            raise ValueError(f"Unknown memory cache policy: {policy}")
+        
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._access_times: Dict[str, float] = {}
+        self._sketch = _FrequencySketch(max_size) if policy == "tinylfu" else None
+        # Keys are strings, or argument tuples under the identity key
+        # strategy. Entries are (value, expiry) with expiry on the
+        # time.monotonic() clock, kept in least- to most-recently used order
+        # so eviction is a popitem from the front.
+        self._cache: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        # Min-heap of (expiry, sequence, key) so expired entries are found
+        # without checking every hit. Entries that were overwritten, deleted
+        # or evicted stay in the heap until popped and are skipped then.
+        self._expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self._sequence = itertools.count()
+        # One lock acquire per public operation; private helpers assume it
+        # is held and never call back into public methods
+        self._lock = threading.Lock()
         
     def _evict_if_needed(self) -> None:
-        """Evict oldest items if cache is full."""
-        if len(self._cache) >= self.max_size:
-            # Remove oldest accessed item
-            oldest_key = min(self._access_times.keys(), key=lambda k: self._access_times[k])
-            self.delete(oldest_key)
-    
-    def _is_expired(self, item: Dict[str, Any]) -> bool:
-        """Check if cached item is expired."""
-        if item.get("ttl") is None:
-            return False
-        return time.time() > item["timestamp"] + item["ttl"]
+        """Evict least recently used items if cache is full."""
+        while self._cache and len(self._cache) >= self.max_size:
+            self._cache.popitem(last=False)
     
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from memory cache."""
-        if key not in self._cache:
-            return None
-            
-        item = self._cache[key]
-        
-        # Check expiration
-        if self._is_expired(item):
-            self.delete(key)
-            return None
-            
-        # Update access time
-        self._access_times[key] = time.time()
-        
-        return item["value"]
+    def _admit(self, key: Hashable) -> bool:
+        """Decide whether a new key may displace the LRU entry."""
+        if self._sketch is None or len(self._cache) < self.max_size:
+            return True
+        victim = next(iter(self._cache))
+        return self._sketch.estimate(key) >= self._sketch.estimate(victim)
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Set value in memory cache."""
+    def _insert(self, key: Hashable, value: Any, expiry: float) -> None:
+        """Insert an entry as most recently used, evicting if needed."""
+        # Drop any existing entry first so it is reinserted as most recent
+        # and does not count towards eviction.
+        if self._cache.pop(key, None) is None and not self._admit(key):
+            return
         self._evict_if_needed()
+        self._cache[key] = (value, expiry)
         
+        if expiry != math.inf:
+            heap = self._expiry_heap
+            heapq.heappush(heap, (expiry, next(self._sequence), key))
+            if len(heap) > 2 * self.max_size + 64:
+                self._rebuild_expiry_heap()
+    
+    def _rebuild_expiry_heap(self) -> None:
+        """Drop stale heap entries left behind by overwrites and evictions."""
+        sequence = self._sequence
+        self._expiry_heap = [
+            (expiry, next(sequence), key)
+            for key, (_, expiry) in self._cache.items()
+            if expiry != math.inf
+        ]
+        heapq.heapify(self._expiry_heap)
+    
+    def _remove_expired(self, now: float) -> int:
+        """Pop expired entries off the heap and return how many were removed."""
+        heap = self._expiry_heap
+        cache = self._cache
+        removed = 0
+        while heap and heap[0][0] < now:
+            expiry, _, key = heapq.heappop(heap)
+            item = cache.get(key)
+            # Skip heap entries for keys that were since rewritten
+            if item is not None and item[1] == expiry:
+                del cache[key]
+                removed += 1
+        return removed
+    
+    def _expiry(self, ttl: Optional[int], now: float) -> float:
+        """Compute the monotonic expiry time for a TTL."""
         ttl = ttl or self.default_ttl
+        return now + ttl if ttl else math.inf
+    
+    def _lookup(self, key: Hashable, now: float) -> Optional[Tuple[Any, float]]:
+        """Find a live entry and mark it as most recently used."""
+        if self._sketch is not None:
+            self._sketch.increment(key)
         
-        self._cache[key] = {
-            "value": value,
-            "timestamp": time.time(),
-            "ttl": ttl
-        }
-        self._access_times[key] = time.time()
+        self._remove_expired(now)
+        
+        item = self._cache.get(key)
+        if item is not None:
+            # Mark as most recently used
+            self._cache.move_to_end(key)
+        return item
     
-    def delete(self, key: str) -> None:
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get value from memory cache."""
+        now = time.monotonic()
+        with self._lock:
+            item = self._lookup(key, now)
+        
+        return None if item is None else item[0]
+    
+    def get_with_ttl(self, key: Hashable) -> Tuple[Optional[Any], Optional[float]]:
+        """Get value and remaining TTL from memory cache."""
+        now = time.monotonic()
+        with self._lock:
+            item = self._lookup(key, now)
+        
+        if item is None:
+            return None, None
+        value, expiry = item
+        return value, (None if expiry == math.inf else expiry - now)
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in memory cache."""
+        expiry = self._expiry(ttl, time.monotonic())
+        with self._lock:
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            
+            self._insert(key, value, expiry)
+    
+    def delete(self, key: Hashable) -> None:
         """Delete value from memory cache."""
-        self._cache.pop(key, None)
-        self._access_times.pop(key, None)
+        with self._lock:
+            self._cache.pop(key, None)
     
     def clear(self) -> None:
         """Clear all cached values."""
-        self._cache.clear()
-        self._access_times.clear()
+        with self._lock:
+            self._cache.clear()
+            self._expiry_heap.clear()
     
-    def exists(self, key: str) -> bool:
+    def exists(self, key: Hashable) -> bool:
         """Check if key exists in cache."""
-        if key not in self._cache:
-            return False
-            
-        item = self._cache[key]
-        if self._is_expired(item):
-            self.delete(key)
-            return False
-            
-        return True
+        now = time.monotonic()
+        with self._lock:
+            self._remove_expired(now)
+            return key in self._cache
+    
+    def set_many(self, items: Dict[Hashable, Any], ttl: Optional[int] = None) -> None:
+        """Set several values in memory cache with a shared expiry."""
+        expiry = self._expiry(ttl, time.monotonic())
+        with self._lock:
+            for key, value in items.items():
+                if self._sketch is not None:
+                    self._sketch.increment(key)
+                self._insert(key, value, expiry)
     
     def size(self) -> int:
         """Get current cache size."""
@@ -128,40 +425,121 @@ class MemoryCache(CacheBackend):
     
     def cleanup_expired(self) -> int:
         """Remove expired items and return count of removed items."""
-        expired_keys = []
-        for key, item in self._cache.items():
-            if self._is_expired(item):
-                expired_keys.append(key)
+        now = time.monotonic()
+        with self._lock:
+            return self._remove_expired(now)
+
+
+class StripedMemoryCache(CacheBackend):
+    """Memory cache split into independently locked stripes."""
+    
+    def __init__(
+        self,
+        stripes: int = 16,
+        max_size: int = 1000,
+        default_ttl: int = 3600,
+        policy: str = "lru"
+    ):
+        """
+        Initialize striped memory cache.
         
-        for key in expired_keys:
-            self.delete(key)
-            
-        return len(expired_keys)
+        Args:
+            stripes: Number of stripes, a power of two
+            max_size: Maximum number of items across all stripes
+            default_ttl: Default TTL in seconds
+            policy: Admission policy for each stripe (see MemoryCache)
+        """
+        if stripes < 1 or stripes & (stripes - 1):
+            raise ValueError("Number of stripes must be a power of two")
+        
+        stripe_size = -(-max_size // stripes)
+        self._mask = stripes - 1
+        self.stripes = [
+            MemoryCache(max_size=stripe_size, default_ttl=default_ttl, policy=policy)
+            for _ in range(stripes)
+        ]
+    
+    def _stripe(self, key: Hashable) -> MemoryCache:
+        """Select the stripe owning ``key``."""
+        return self.stripes[hash(key) & self._mask]
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get value from the owning stripe."""
+        return self._stripe(key).get(key)
+    
+    def get_with_ttl(self, key: Hashable) -> Tuple[Optional[Any], Optional[float]]:
+        """Get value and remaining TTL from the owning stripe."""
+        return self._stripe(key).get_with_ttl(key)
+    
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in the owning stripe."""
+        self._stripe(key).set(key, value, ttl)
+    
+    def delete(self, key: Hashable) -> None:
+        """Delete value from the owning stripe."""
+        self._stripe(key).delete(key)
+    
+    def clear(self) -> None:
+        """Clear all stripes."""
+        for stripe in self.stripes:
+            stripe.clear()
+    
+    def exists(self, key: Hashable) -> bool:
+        """Check if key exists in the owning stripe."""
+        return self._stripe(key).exists(key)
+    
+    def size(self) -> int:
+        """Get current cache size across all stripes."""
+        return sum(stripe.size() for stripe in self.stripes)
+    
+    def cleanup_expired(self) -> int:
+        """Remove expired items from every stripe and return the count removed."""
+        return sum(stripe.cleanup_expired() for stripe in self.stripes)
 
 
 class RedisCache(CacheBackend):
     """Redis-based cache implementation."""
     
-    def __init__(self, redis_url: str, default_ttl: int = 3600):
+    def __init__(
+        self,
+        redis_url: str,
+        default_ttl: int = 3600,
+        pool_size: int = 32,
+        socket_timeout: float = 2.0
+    ):
         """
         Initialize Redis cache.
         
         Args:
             redis_url: Redis connection URL
             default_ttl: Default TTL in seconds
+            pool_size: Maximum number of pooled connections
+            socket_timeout: Socket read/write timeout in seconds
         """
         try:
-            import redis
-            self.redis_client = redis.from_url(redis_url, decode_responses=False)
+            # Bounded pool with keepalive and health checks so stale
+            # connections are replaced before a request hits them
+            pool = redis.ConnectionPool.from_url(
+                redis_url,
+                max_connections=pool_size,
+                socket_keepalive=True,
+                socket_timeout=socket_timeout,
+                socket_connect_timeout=1.0,
+                health_check_interval=30,
+                retry=Retry(ExponentialBackoff(), 3),
+                retry_on_timeout=True,
+                retry_on_error=[redis.exceptions.ConnectionError, redis.exceptions.TimeoutError],
+                decode_responses=False
+            )
+            self.redis_client = redis.Redis(connection_pool=pool)
             self.default_ttl = default_ttl
             # Test connection
             self.redis_client.ping()
-            logger.info(f"Connected to Redis at {redis_url}")
-        except ImportError:
-            logger.error("Redis package not installed. Install with: pip install redis")
-            raise
+            # redis-py picks the C RESP parser automatically when hiredis is
+            # installed; log which one is in use so deployments can check
+            logger.info("Connected to Redis at %s (%s parser)", redis_url, _REDIS_PARSER)
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
+            logger.error("Failed to connect to Redis: %s", e)
             raise
     
     def get(self, key: str) -> Optional[Any]:
@@ -170,38 +548,171 @@ class RedisCache(CacheBackend):
             data = self.redis_client.get(key)
             if data is None:
                 return None
-            return pickle.loads(data)
+            return _deserialize(data)
         except Exception as e:
-            logger.warning(f"Failed to get from Redis cache: {e}")
+            logger.warning("Failed to get from Redis cache: %s", e)
             return None
     
+    def get_with_ttl(self, key: str) -> Tuple[Optional[Any], Optional[float]]:
+        """Get value and remaining TTL from Redis cache in a single round trip."""
+        return self.get_many_with_ttl([key])[0]
+    
+    def get_many_with_ttl(self, keys: Iterable[str]) -> List[Tuple[Optional[Any], Optional[float]]]:
+        """Get several values and their remaining TTLs in a single round trip."""
+        keys = list(keys)
+        try:
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(key)
+                    pipe.pttl(key)
+                replies = pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to get many from Redis cache: %s", e)
+            return [(None, None)] * len(keys)
+        
+        results = []
+        for payload, pttl in zip(replies[::2], replies[1::2]):
+            try:
+                value = None if payload is None else _deserialize(payload)
+            except Exception as e:
+                logger.warning("Failed to decode Redis cache entry: %s", e)
+                value = None
+            # PTTL is -1 for keys without an expiry and -2 for missing keys
+            results.append((value, pttl / 1000 if pttl >= 0 else None))
+        return results
+    
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in Redis cache."""
         try:
             ttl = ttl or self.default_ttl
-            data = pickle.dumps(value)
+            data = _serialize(value)
             self.redis_client.setex(key, ttl, data)
         except Exception as e:
-            logger.warning(f"Failed to set in Redis cache: {e}")
+            logger.warning("Failed to set in Redis cache: %s", e)
+    
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """Get several values from Redis cache in a single round trip."""
+        keys = list(keys)
+        try:
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(key)
+                payloads = pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to get many from Redis cache: %s", e)
+            return [None] * len(keys)
+        
+        values = []
+        for payload in payloads:
+            try:
+                values.append(None if payload is None else _deserialize(payload))
+            except Exception as e:
+                logger.warning("Failed to decode Redis cache entry: %s", e)
+                values.append(None)
+        return values
+    
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set several values in Redis cache in a single round trip."""
+        try:
+            ttl = ttl or self.default_ttl
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, _serialize(value))
+                pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to set many in Redis cache: %s", e)
     
     def delete(self, key: str) -> None:
         """Delete value from Redis cache."""
         try:
             self.redis_client.delete(key)
         except Exception as e:
-            logger.warning(f"Failed to delete from Redis cache: {e}")
+            logger.warning("Failed to delete from Redis cache: %s", e)
     
     def clear(self) -> None:
         """Clear all cached values."""
         try:
             self.redis_client.flushdb()
         except Exception as e:
-            logger.warning(f"Failed to clear Redis cache: {e}")
+            logger.warning("Failed to clear Redis cache: %s", e)
     
     def exists(self, key: str) -> bool:
         """Check if key exists in Redis cache."""
         try:
             return bool(self.redis_client.exists(key))
         except Exception as e:
-            logger.warning(f"Failed to check Redis cache existence: {e}")
-            return False 
\ No newline at end of file
+            logger.warning("Failed to check Redis cache existence: %s", e)
+            return False
+
+
+class TieredCache(CacheBackend):
+    """Two-level cache with a small in-process front for a shared backend."""
+    
+    def __init__(self, l1: MemoryCache, l2: CacheBackend):
+        """
+        Initialize tiered cache.
+        
+        Args:
+            l1: Small in-process cache holding deserialized values
+            l2: Shared backend, typically RedisCache
+        """
+        self.l1 = l1
+        self.l2 = l2
+    
+    def _promote(self, key: str, value: Any, remaining: Optional[float]) -> None:
+        """Copy a shared-cache hit into the front cache without outliving it."""
+        if value is None:
+            return
+        ttl = self.l1.default_ttl
+        if remaining is not None:
+            if remaining <= 0:
+                return
+            ttl = min(ttl, remaining) if ttl else remaining
+        # Keep the deserialized object so hot keys skip decoding
+        self.l1.set(key, value, ttl)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from the front cache, falling back to the shared one."""
+        value = self.l1.get(key)
+        if value is not None:
+            return value
+        
+        value, remaining = self.l2.get_with_ttl(key)
+        self._promote(key, value, remaining)
+        return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in both cache levels."""
+        self.l1.set(key, value, ttl)
+        self.l2.set(key, value, ttl)
+    
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """Get several values, fetching only front-cache misses from the shared cache."""
+        keys = list(keys)
+        values = self.l1.get_many(keys)
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            fetched = self.l2.get_many_with_ttl([keys[i] for i in missing])
+            for i, (value, remaining) in zip(missing, fetched):
+                values[i] = value
+                self._promote(keys[i], value, remaining)
+        return values
+    
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set several values in both cache levels."""
+        self.l1.set_many(items, ttl)
+        self.l2.set_many(items, ttl)
+    
+    def delete(self, key: str) -> None:
+        """Delete value from both cache levels."""
+        self.l1.delete(key)
+        self.l2.delete(key)
+    
+    def clear(self) -> None:
+        """Clear both cache levels."""
+        self.l1.clear()
+        self.l2.clear()
+    
+    def exists(self, key: str) -> bool:
+        """Check if key exists in either cache level."""
+        return self.l1.exists(key) or self.l2.exists(key)
\ No newline at end of file
@@ -25,7 +25,7 @@ def initialize_cache(config: Dict[str, Any]) -> None:
     """Initialize the global cache manager."""
     global cache_manager
     cache_manager = create_cache_manager(config)
-    logger.info(f"Initialized cache with backend: {type(cache_manager.backend).__name__}")
+    logger.info("Initialized cache with backend: %s", type(cache_manager.backend).__name__)
 
 
 def clear_cache() -> None:
@@ -9,65 +9,56 @@ from functools import wraps
 from .core import get_cache_manager
 
 
-def cached_klein_bottle(ttl: Optional[int] = None):
-    """Cache decorator for Klein bottle computations."""
+def _make_cached(prefix: str, ttl: Optional[int] = None):
+    """
+    Build a caching decorator for a key prefix.
+    
+    The cached wrapper is created once per cache manager instead of on
+    every call, and is rebuilt only if the global manager is replaced.
+    
+    Args:
+        prefix: Cache key prefix
+        ttl: Time to live in seconds
+        
+    Returns:
+        Decorator applying the cache manager lazily
+    """
     def decorator(func):
+        # (cache manager, cached function) once the cache is initialized
+        bound = [None]
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 cache_manager = get_cache_manager()
-                cached_func = cache_manager.cached_computation("klein_bottle", ttl)(func)
-                return cached_func(*args, **kwargs)
             except RuntimeError:
                 # Cache not initialized, call function directly
                 return func(*args, **kwargs)
+            
+            state = bound[0]
+            if state is None or state[0] is not cache_manager:
+                state = (cache_manager, cache_manager.cached_computation(prefix, ttl)(func))
+                bound[0] = state
+            return state[1](*args, **kwargs)
         return wrapper
     return decorator
 
 
+def cached_klein_bottle(ttl: Optional[int] = None):
+    """Cache decorator for Klein bottle computations."""
+    return _make_cached("klein_bottle", ttl)
+
+
 def cached_mobius_strip(ttl: Optional[int] = None):
     """Cache decorator for Möbius strip computations."""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                cache_manager = get_cache_manager()
-                cached_func = cache_manager.cached_computation("mobius_strip", ttl)(func)
-                return cached_func(*args, **kwargs)
-            except RuntimeError:
-                # Cache not initialized, call function directly
-                return func(*args, **kwargs)
-        return wrapper
-    return decorator
+    return _make_cached("mobius_strip", ttl)
 
 
 def cached_torus(ttl: Optional[int] = None):
     """Cache decorator for torus computations."""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                cache_manager = get_cache_manager()
-                cached_func = cache_manager.cached_computation("torus", ttl)(func)
-                return cached_func(*args, **kwargs)
-            except RuntimeError:
-                # Cache not initialized, call function directly
-                return func(*args, **kwargs)
-        return wrapper
-    return decorator
+    return _make_cached("torus", ttl)
 
 
 def cached_topology(ttl: Optional[int] = None):
     """Cache decorator for topological computations."""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                cache_manager = get_cache_manager()
-                cached_func = cache_manager.cached_computation("topology", ttl)(func)
-                return cached_func(*args, **kwargs)
-            except RuntimeError:
-                # Cache not initialized, call function directly
-                return func(*args, **kwargs)
-        return wrapper
-    return decorator 
\ No newline at end of file
+    return _make_cached("topology", ttl)
\ No newline at end of file
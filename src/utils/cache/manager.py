@@ -3,38 +3,255 @@ Cache manager for SKB Visualization Application.
 Provides central cache management and key generation.
 """
 
-import json
 import hashlib
 import logging
-from typing import Any, Dict, Callable, TypeVar, Union
-from functools import wraps
+import math
+import pickle
+import queue
+import struct
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Callable, Hashable, List, Optional, Tuple, TypeVar, Union
+from functools import lru_cache, wraps
 
 import numpy as np
+import xxhash
 
-from .backends import CacheBackend, MemoryCache, RedisCache
+from .backends import CacheBackend, MemoryCache, RedisCache, StripedMemoryCache, TieredCache
 
 # Type variable for generic function caching
 T = TypeVar('T')
 
 logger = logging.getLogger(__name__)
 
+# Number of generated keys remembered per cache manager
+_KEY_MEMO_SIZE = 4096
+
+# Results holding more array data than this are recomputed, not cached
+_DEFAULT_MAX_CACHED_BYTES = 4 * 1024 * 1024
+
+# Pending background writes; further results are dropped while it is full
+_WRITE_QUEUE_SIZE = 256
+
+_KEY_STRATEGIES = ("hash", "identity")
+
+_KEY_ALGORITHMS = ("fast", "sha256")
+
+# Hex characters kept from each digest; 128 bits for every algorithm
+_KEY_HEX_LENGTH = 32
+
+# Largest magnitude below which every integer is exactly a double
+_MAX_EXACT_INT = 2**53
+
+_SCALAR_TYPES = frozenset((str, bytes, int, bool, type(None)))
+
+
+def _memo_signature(value: Any) -> Any:
+    """
+    Build a hashable type signature for memoizing key generation.
+    
+    Values that compare equal must also hash to the same cache key for the
+    memo to be valid, so the signature separates 1, 1.0 and True as well
+    as 0.0 and -0.0. Only immutable scalars, strings and tuples of them are
+    memoized; any other object could change after its key was remembered,
+    so it is hashed afresh on every call.
+    
+    Args:
+        value: Argument value
+        
+    Returns:
+        Any: Signature, or None if the value cannot be memoized
+    """
+    cls = type(value)
+    if cls is float:
+        return (float, math.copysign(1.0, value))
+    if cls in _SCALAR_TYPES:
+        return cls
+    if cls is tuple:
+        parts = tuple(_memo_signature(item) for item in value)
+        return None if any(part is None for part in parts) else parts
+    return None
+
+
+def _type_signature(value: Any) -> Any:
+    """
+    Build the type signature of an argument used directly as a cache key.
+    
+    Like ``_memo_signature`` it separates 1, 1.0 and True as well as 0.0
+    and -0.0, but any other hashable object is represented by its type and
+    left to its own equality.
+    
+    Args:
+        value: Hashable argument value
+        
+    Returns:
+        Any: Hashable signature
+    """
+    cls = type(value)
+    if cls is float:
+        return (float, math.copysign(1.0, value))
+    if cls is tuple:
+        return tuple(_type_signature(item) for item in value)
+    return cls
+
+
+def _array_nbytes(value: Any) -> int:
+    """
+    Estimate the array payload of a result without a deep traversal.
+    
+    Args:
+        value: Computation result
+        
+    Returns:
+        int: The result's ``nbytes`` when it defines one (arrays, and
+        mappings that can size themselves without computing lazy values),
+        otherwise the bytes of the arrays directly inside it when it is a
+        mapping, list or tuple
+    """
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, Mapping):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return 0
+    return sum(item.nbytes for item in value if isinstance(item, np.ndarray))
+
+
+def _new_key_hasher(algorithm: str = "fast"):
+    """
+    Create the incremental hasher used for cache keys.
+    
+    Args:
+        algorithm: "fast" for xxh3-128, or
+            "sha256" when keys must resist deliberate collisions
+        
+    Returns:
+        Hash object with ``update`` and ``hexdigest``
+    """
+    if algorithm == "sha256":
+        # OpenSSL uses the SHA extensions on CPUs that have them
+        return hashlib.sha256()
+    return xxhash.xxh3_128()
+
+
+def _update_key_hash(hasher: Any, value: Any) -> None:
+    """
+    Feed a single argument into a cache key hasher.
+    
+    Every value is prefixed with a type tag (and lengths where needed) so
+    that different argument layouts cannot produce the same byte stream.
+    Numbers are canonicalized to IEEE 754 bits: numpy scalars are unwrapped,
+    integers that a double represents exactly hash like the equal float,
+    and every NaN hashes alike.
+    
+    Args:
+        hasher: Incremental hash object to update
+        value: Argument value to hash
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    
+    if isinstance(value, np.ndarray):
+        hasher.update(b"A")
+        hasher.update(value.dtype.str.encode())
+        hasher.update(struct.pack(f"<{value.ndim + 1}q", value.ndim, *value.shape))
+        hasher.update(np.ascontiguousarray(value).data)
+    elif value is None or isinstance(value, bool):
+        hasher.update(b"N" if value is None else (b"T" if value else b"F"))
+    elif isinstance(value, int) and -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT:
+        hasher.update(b"D")
+        hasher.update(struct.pack("<d", value))
+    elif isinstance(value, int) and -2**63 <= value < 2**63:
+        hasher.update(b"I")
+        hasher.update(struct.pack("<q", value))
+    elif isinstance(value, float):
+        hasher.update(b"D")
+        hasher.update(struct.pack("<d", value if value == value else math.nan))
+    elif isinstance(value, (str, bytes)):
+        data = value.encode() if isinstance(value, str) else value
+        hasher.update(b"S" if isinstance(value, str) else b"B")
+        hasher.update(struct.pack("<q", len(data)))
+        hasher.update(data)
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"L")
+        hasher.update(struct.pack("<q", len(value)))
+        for item in value:
+            _update_key_hash(hasher, item)
+    elif isinstance(value, dict):
+        hasher.update(b"M")
+        hasher.update(struct.pack("<q", len(value)))
+        for key, item in sorted(value.items(), key=lambda kv: str(kv[0])):
+            _update_key_hash(hasher, key)
+            _update_key_hash(hasher, item)
+    else:
+        # Array buffers inside the object are hashed out-of-band instead of
+        # being copied into the pickle stream
+        buffers = []
+        try:
+            data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        except Exception:
+            # Unpicklable objects fall back to their string form, as before
+            data = str(value).encode()
+            buffers = []
+        hasher.update(b"O")
+        hasher.update(struct.pack("<qq", len(data), len(buffers)))
+        hasher.update(data)
+        for buffer in buffers:
+            raw = buffer.raw()
+            hasher.update(struct.pack("<q", raw.nbytes))
+            hasher.update(raw)
+
 
 class CacheManager:
     """Central cache manager for the application."""
     
-    def __init__(self, backend: CacheBackend):
+    def __init__(
+        self,
+        backend: CacheBackend,
+        key_strategy: str = "hash",
+        max_cached_bytes: Optional[int] = _DEFAULT_MAX_CACHED_BYTES,
+        background_writes: bool = False,
+        key_algorithm: str = "fast"
+    ):
         """
         Initialize cache manager.
         
         Args:
             backend: Cache backend implementation
+            key_strategy: "hash" for hex digest string keys, or "identity"
+                to use the argument tuple itself as the key whenever it is
+                hashable (in-process backends only)
+            max_cached_bytes: Results whose arrays exceed this many bytes
+                are returned without being stored; None stores everything
+            background_writes: Store computed results from a daemon writer
+                thread so a cache miss does not wait on the backend
+            key_algorithm: "fast" (xxh3) or "sha256" for hashed keys
         """
+        if key_strategy not in _KEY_STRATEGIES:
+            raise ValueError(f"Unknown cache key strategy: {key_strategy}")
+        if key_algorithm not in _KEY_ALGORITHMS:
+            raise ValueError(f"Unknown cache key algorithm: {key_algorithm}")
+        
         self.backend = backend
+        self.key_strategy = key_strategy
+        self.key_algorithm = key_algorithm
+        self.max_cached_bytes = max_cached_bytes
         self.hit_count = 0
         self.miss_count = 0
         self.total_requests = 0
+        # Counter updates are read-modify-write, so gthread workers sharing
+        # a manager would lose increments without a lock
+        self._stats_lock = threading.Lock()
+        self._memoized_key = lru_cache(maxsize=_KEY_MEMO_SIZE)(self._memo_key)
+        self.background_writes = background_writes
+        self._write_queue: "queue.Queue[Tuple[Hashable, Any, Optional[int]]]" = queue.Queue(
+            maxsize=_WRITE_QUEUE_SIZE
+        )
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
     
-    def generate_key(self, prefix: str, *args, **kwargs) -> str:
+    def generate_key(self, prefix: str, *args, **kwargs) -> Hashable:
         """
         Generate cache key from function arguments.
         
@@ -44,45 +261,145 @@ class CacheManager:
             **kwargs: Keyword arguments
             
         Returns:
-            str: Generated cache key
+            Hashable: Generated cache key, a string unless the identity
+            strategy applies
         """
-        # Convert numpy arrays to lists for hashing
-        serializable_args = []
+        items = tuple(sorted(kwargs.items())) if kwargs else ()
+        
+        # Repeated calls with hashable scalar arguments reuse the key
+        signature = _memo_signature((args, items))
+        if signature is not None:
+            if self.key_strategy == "identity":
+                return (prefix, args, items, signature)
+            return self._memoized_key(prefix, args, items, signature)
+        return self._hash_key(prefix, args, items)
+    
+    def _memo_key(
+        self,
+        prefix: str,
+        args: Tuple[Any, ...],
+        items: Tuple[Tuple[str, Any], ...],
+        signature: Any
+    ) -> str:
+        """Hash a key for the memo; ``signature`` only separates memo entries."""
+        return self._hash_key(prefix, args, items)
+    
+    def _hash_key(
+        self,
+        prefix: str,
+        args: Tuple[Any, ...],
+        items: Tuple[Tuple[str, Any], ...]
+    ) -> str:
+        """Hash positional arguments and sorted keyword items into a key."""
+        hasher = _new_key_hasher(self.key_algorithm)
         for arg in args:
-            if isinstance(arg, np.ndarray):
-                serializable_args.append(arg.tolist())
-            else:
-                serializable_args.append(arg)
-        
-        serializable_kwargs = {}
-        for key, value in kwargs.items():
-            if isinstance(value, np.ndarray):
-                serializable_kwargs[key] = value.tolist()
-            else:
-                serializable_kwargs[key] = value
-        
-        # Create hashable string
-        cache_data = {
-            "args": serializable_args,
-            "kwargs": serializable_kwargs
-        }
+            _update_key_hash(hasher, arg)
+        for key, value in items:
+            _update_key_hash(hasher, key)
+            _update_key_hash(hasher, value)
+        
+        return f"{prefix}:{hasher.hexdigest()[:_KEY_HEX_LENGTH]}"
+    
+    def get_many(self, keys: List[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Prefetch several cache entries with one backend call.
+        
+        Lets a handler that needs multiple surfaces look them all up at
+        once, which is a single round trip on the Redis backend.
+        
+        Args:
+            keys: Cache keys, typically built with ``generate_key``
+            
+        Returns:
+            Dict[Hashable, Any]: Mapping of the keys that were found to their values
+        """
+        values = self.backend.get_many(keys)
+        found = {key: value for key, value in zip(keys, values) if value is not None}
         
-        cache_string = json.dumps(cache_data, sort_keys=True, default=str)
-        cache_hash = hashlib.md5(cache_string.encode()).hexdigest()
+        self._record(requests=len(keys), hits=len(found), misses=len(keys) - len(found))
+        return found
+    
+    def set_many(self, items: Dict[Hashable, Any], ttl: Optional[int] = None) -> None:
+        """
+        Store several computed results with one backend call.
         
-        return f"{prefix}:{cache_hash}"
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time to live in seconds
+        """
+        try:
+            self.backend.set_many(items, ttl)
+        except Exception as e:
+            logger.warning("Failed to cache results: %s", e)
+    
+    def _store(self, key: Hashable, value: Any, ttl: Optional[int]) -> None:
+        """Store a computed result, on the writer thread if enabled."""
+        if not self.background_writes:
+            try:
+                self.backend.set(key, value, ttl)
+                logger.debug("Cached result for key: %s", key)
+            except Exception as e:
+                logger.warning("Failed to cache result: %s", e)
+            return
+        
+        self._start_writer()
+        try:
+            self._write_queue.put_nowait((key, value, ttl))
+        except queue.Full:
+            logger.debug("Write queue full, not caching key: %s", key)
+    
+    def _start_writer(self) -> None:
+        """Start the background writer thread on first use."""
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                # Started lazily so it is created inside the worker process
+                self._writer = threading.Thread(
+                    target=self._drain_writes, name="cache-writer", daemon=True
+                )
+                self._writer.start()
+    
+    def _drain_writes(self) -> None:
+        """Write queued results to the backend until the process exits."""
+        while True:
+            key, value, ttl = self._write_queue.get()
+            try:
+                self.backend.set(key, value, ttl)
+                logger.debug("Cached result for key: %s", key)
+            except Exception as e:
+                logger.warning("Failed to cache result: %s", e)
+            finally:
+                self._write_queue.task_done()
+    
+    def flush_writes(self) -> None:
+        """Block until every queued background write has reached the backend."""
+        if self._writer is not None:
+            self._write_queue.join()
+    
+    def _record(self, requests: int = 1, hits: int = 0, misses: int = 0) -> None:
+        """Update the request, hit and miss counters under one lock acquire."""
+        with self._stats_lock:
+            self.total_requests += requests
+            self.hit_count += hits
+            self.miss_count += misses
     
     def get_stats(self) -> Dict[str, Union[int, float]]:
         """Get cache statistics."""
-        if self.total_requests == 0:
+        with self._stats_lock:
+            total_requests = self.total_requests
+            hits = self.hit_count
+            misses = self.miss_count
+        
+        if total_requests == 0:
             hit_rate = 0.0
         else:
-            hit_rate = self.hit_count / self.total_requests
+            hit_rate = hits / total_requests
         
         return {
-            "total_requests": self.total_requests,
-            "hits": self.hit_count,
-            "misses": self.miss_count,
+            "total_requests": total_requests,
+            "hits": hits,
+            "misses": misses,
             "hit_rate": hit_rate
         }
     
@@ -90,7 +407,8 @@ class CacheManager:
         self, 
         key_prefix: str, 
         ttl: int = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        hashable_args: bool = False
     ) -> Callable[[Callable[..., T]], Callable[..., T]]:
         """
         Decorator for caching expensive computational functions.
@@ -99,40 +417,66 @@ class CacheManager:
             key_prefix: Cache key prefix
             ttl: Time to live in seconds
             use_cache: Whether to use caching
+            hashable_args: The function only takes hashable arguments, so
+                with an in-process backend the argument tuple is used as the
+                key directly and ``generate_key`` is skipped
             
         Returns:
             Decorated function
         """
         def decorator(func: Callable[..., T]) -> Callable[..., T]:
-            @wraps(func)
-            def wrapper(*args, **kwargs) -> T:
-                self.total_requests += 1
-                
-                if not use_cache:
+            if not use_cache:
+                # Decided once here so uncached calls never build a key
+                @wraps(func)
+                def uncached_wrapper(*args, **kwargs) -> T:
+                    self._record()
                     return func(*args, **kwargs)
                 
+                return uncached_wrapper
+            
+            # Tuple keys only work with backends that keep keys in memory
+            direct_keys = hashable_args and isinstance(
+                self.backend, (MemoryCache, StripedMemoryCache)
+            )
+            
+            @wraps(func)
+            def wrapper(*args, **kwargs) -> T:
                 # Generate cache key
-                cache_key = self.generate_key(key_prefix, *args, **kwargs)
+                if direct_keys:
+                    # The signature keeps 1, 1.0, True and 0.0, -0.0 apart in
+                    # both positional and keyword arguments
+                    items = tuple(sorted(kwargs.items())) if kwargs else ()
+                    cache_key = (key_prefix, args, items, _type_signature((args, items)))
+                    try:
+                        hash(cache_key)
+                    except TypeError:
+                        cache_key = self.generate_key(key_prefix, *args, **kwargs)
+                else:
+                    cache_key = self.generate_key(key_prefix, *args, **kwargs)
                 
                 # Try to get from cache
                 cached_result = self.backend.get(cache_key)
                 if cached_result is not None:
-                    self.hit_count += 1
-                    logger.debug(f"Cache hit for key: {cache_key}")
+                    self._record(hits=1)
+                    logger.debug("Cache hit for key: %s", cache_key)
                     return cached_result
                 
                 # Cache miss - compute result
-                self.miss_count += 1
-                logger.debug(f"Cache miss for key: {cache_key}")
+                self._record(misses=1)
+                logger.debug("Cache miss for key: %s", cache_key)
                 
                 result = func(*args, **kwargs)
                 
+                # Very large results cost more to store than to recompute
+                if (
+                    self.max_cached_bytes is not None
+                    and _array_nbytes(result) > self.max_cached_bytes
+                ):
+                    logger.debug("Result too large to cache for key: %s", cache_key)
+                    return result
+                
                 # Store in cache
-                try:
-                    self.backend.set(cache_key, result, ttl)
-                    logger.debug(f"Cached result for key: {cache_key}")
-                except Exception as e:
-                    logger.warning(f"Failed to cache result: {e}")
+                self._store(cache_key, result, ttl)
                 
                 return result
             
@@ -140,6 +484,27 @@ class CacheManager:
         return decorator
 
 
+def _create_memory_cache(config: Dict[str, Any]) -> CacheBackend:
+    """
+    Create the in-process cache backend described by a configuration.
+    
+    Args:
+        config: Cache configuration
+        
+    Returns:
+        CacheBackend: MemoryCache, or StripedMemoryCache if "stripes" > 1
+    """
+    options = {
+        "max_size": config.get("max_size", 1000),
+        "default_ttl": config.get("ttl", 3600),
+        "policy": config.get("policy", "lru")
+    }
+    stripes = config.get("stripes", 1)
+    if stripes > 1:
+        return StripedMemoryCache(stripes=stripes, **options)
+    return MemoryCache(**options)
+
+
 def create_cache_manager(config: Dict[str, Any]) -> CacheManager:
     """
     Create cache manager based on configuration.
@@ -151,23 +516,39 @@ def create_cache_manager(config: Dict[str, Any]) -> CacheManager:
         CacheManager: Configured cache manager
     """
     backend_type = config.get("backend", "memory")
+    key_strategy = config.get("key_strategy", "hash")
+    # Writes are synchronous unless a writer thread is requested; it only
+    # pays off for remote backends
+    background_writes = config.get("background_writes", False)
     
     if backend_type == "redis" and config.get("url"):
         try:
             backend = RedisCache(
                 redis_url=config["url"],
-                default_ttl=config.get("ttl", 3600)
+                default_ttl=config.get("ttl", 3600),
+                pool_size=config.get("pool_size", 32),
+                socket_timeout=config.get("socket_timeout", 2.0)
             )
+            l1_size = config.get("l1_size", 0)
+            if l1_size:
+                # Serve hot keys from process memory without unpickling; each
+                # worker's copy may lag writes made by other workers
+                backend = TieredCache(
+                    MemoryCache(max_size=l1_size, default_ttl=config.get("ttl", 3600)),
+                    backend
+                )
+            # Redis keys must be strings
+            key_strategy = "hash"
         except Exception as e:
-            logger.warning(f"Failed to create Redis cache, falling back to memory: {e}")
-            backend = MemoryCache(
-                max_size=config.get("max_size", 1000),
-                default_ttl=config.get("ttl", 3600)
-            )
+            logger.warning("Failed to create Redis cache, falling back to memory: %s", e)
+            backend = _create_memory_cache(config)
     else:
-        backend = MemoryCache(
-            max_size=config.get("max_size", 1000),
-            default_ttl=config.get("ttl", 3600)
-        )
+        backend = _create_memory_cache(config)
     
-    return CacheManager(backend) 
\ No newline at end of file
+    return CacheManager(
+        backend,
+        key_strategy=key_strategy,
+        max_cached_bytes=config.get("max_cached_bytes", _DEFAULT_MAX_CACHED_BYTES),
+        background_writes=background_writes,
+        key_algorithm=config.get("key_algorithm", "fast")
+    ) 
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+JSON provider for SKB Visualization Application.
+Serializes NumPy arrays and scalars at the response boundary.
+"""
+
+from types import MappingProxyType
+from typing import Any
+
+import numpy as np
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+
+class NumpyJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that understands NumPy arrays and scalars.
+    
+    Lets computation code hand arrays straight to ``jsonify`` instead of
+    converting them with ``tolist()`` up front. Responses are encoded with
+    orjson, which serializes contiguous arrays directly from their buffers.
+    """
+    
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Convert NumPy objects and read-only mappings to JSON-compatible values."""
+        if isinstance(o, np.ndarray):
+            # JSON has no NaN, so send null (orjson does the same for
+            # arrays it serializes natively)
+            if o.dtype.kind == 'f' and np.isnan(o).any():
+                return np.where(np.isnan(o), None, o).tolist()
+            return o.tolist()
+        if isinstance(o, np.generic):
+            return o.item()
+        if isinstance(o, MappingProxyType):
+            # Read-only views of shared trace styling
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize the given arguments as a JSON response.
+        
+        Mirrors ``DefaultJSONProvider.response`` (key sorting, indentation in
+        debug mode) but encodes with orjson.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        # Dates keep Flask's HTTP-date format by passing through to default()
+        option = (
+            orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_APPEND_NEWLINE
+        )
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        
+        return self._app.response_class(
+            orjson.dumps(obj, default=self._orjson_default, option=option),
+            mimetype=self.mimetype
+        )
+    
+    def _orjson_default(self, o: Any) -> Any:
+        """Hand non-contiguous arrays back to orjson as contiguous copies.
+        
+        orjson only serializes C-contiguous arrays natively; copying views
+        such as broadcast parameter grids keeps float32 data in its short
+        single-precision form instead of widening it through ``tolist()``.
+        """
+        if isinstance(o, np.ndarray) and not o.flags.c_contiguous and o.dtype.kind in 'biuf':
+            return np.ascontiguousarray(o)
+        return self.default(o)
@@ -1,3 +1,5 @@
+import pytest
+
 from src.app import app
 
 
@@ -25,3 +27,25 @@ def test_compute_topological_compatibility_route():
     assert response.status_code == 200
     data = response.get_json()
     assert 'compatible' in data
+
+
+@pytest.mark.parametrize('url, payload', [
+    ('/get_skb_visualization', {'kx': 1, 'ky': 2, 'kz': 0.5, 'kt': 0.3, 't': 0.4, 'loop_factor': 2}),
+    ('/get_visualization', {}),
+    ('/get_visualization', {'skb1_kx': 1, 'skb2_ky': -1, 't': 1.0}),
+    ('/compute_evolution', {'population_size': 10, 'generations': 2})
+])
+def test_visualization_routes_return_200(url, payload):
+    client = app.test_client()
+    response = client.post(url, json=payload)
+    assert response.status_code == 200
+    assert 'error' not in response.get_json()
+
+
+@pytest.mark.parametrize('payload', [{'loop2': None}, {'t1x': None}])
+def test_visualization_rejects_null_parameters(payload):
+    client = app.test_client()
+    response = client.post('/get_visualization', json=payload)
+    data = response.get_json()
+    assert data['error']
+    assert 'plot' not in data
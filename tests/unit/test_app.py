@@ -1,6 +1,18 @@
+import pickle
+
 import numpy as np
-from src.mathematics.surfaces import generate_twisted_strip
-from src.services.topology_service import TopologyService
+import pytest
+from flask import jsonify
+
+from src.app import app
+from src.mathematics.fermion_evolution import FermionEvolutionSystem
+from src.mathematics.klein_bottle import KleinBottleGenerator
+from src.mathematics.surfaces import create_enhanced_surface_trace, generate_twisted_strip
+from src.mathematics.topology import generate_topological_field_lines
+from src.services.topology_service import SKBParams, TopologyService
+from src.services.visualization_service import VisualizationService, _surface_geometry
+from src.utils.cache import clear_cache, get_cache_stats, initialize_cache
+from src.utils.json_provider import NumpyJSONProvider
 
 
 def test_generate_twisted_strip_shape():
@@ -35,4 +47,163 @@ def test_compute_topological_compatibility_returns_dict():
     topology_service = TopologyService()
     result = topology_service.compute_compatibility({'skb1': skb1, 'skb2': skb2})
     assert isinstance(result, dict)
-    assert 'compatible' in result
\ No newline at end of file
+    assert 'compatible' in result
+
+
+def test_compute_compatibility_batch_matches_pairwise():
+    skbs = [
+        {'tx': 0.1, 'ty': 0.1, 'tz': 0.1, 'tt': 0.1, 'orientable': 1, 'genus': 0},
+        {'tx': -0.1, 'ty': -0.1, 'tz': -0.1, 'tt': -0.1, 'orientable': 1, 'genus': 0},
+        {'tx': 2.0, 'ty': -1.0, 'tz': 0.0, 'tt': 0.4, 'orientable': 0, 'genus': 1}
+    ]
+    
+    topology_service = TopologyService()
+    batch = topology_service.compute_compatibility_batch(skbs, skbs[:2])
+    assert batch.shape == (3, 2)
+    for i, skb1 in enumerate(skbs):
+        for j, skb2 in enumerate(skbs[:2]):
+            expected = topology_service.compute_compatibility_internal(skb1, skb2)['compatible']
+            assert batch[i, j] == expected
+
+
+def test_compute_compatibility_batch_accepts_columns():
+    skbs = [
+        {'tx': 0.1, 'ty': 0.1, 'tz': 0.1, 'tt': 0.1, 'orientable': 1, 'genus': 0},
+        {'tx': -0.1, 'ty': -0.1, 'tz': -0.1, 'tt': -0.1, 'orientable': 1, 'genus': 0},
+        {'tx': 2.0, 'ty': -1.0, 'tz': 0.0, 'tt': 0.4, 'orientable': 0, 'genus': 1}
+    ]
+    columns = {key: np.array([skb[key] for skb in skbs]) for key in skbs[0]}
+    
+    topology_service = TopologyService()
+    assert (
+        topology_service.compute_compatibility_flags(columns, columns)
+        == topology_service.compute_compatibility_flags(skbs, skbs)
+    ).all()
+
+
+def test_compute_compatibility_accepts_skb_params():
+    skb1 = {'tx': 0.1, 'ty': 0.1, 'tz': 0.1, 'tt': 0.1, 'orientable': 1, 'genus': 0}
+    skb2 = {'tx': -0.1, 'ty': -0.1, 'tz': -0.1, 'tt': -0.1, 'orientable': 1, 'genus': 0}
+    
+    topology_service = TopologyService()
+    assert topology_service.compute_compatibility_internal(
+        SKBParams.from_dict(skb1), SKBParams.from_dict(skb2)
+    ) == topology_service.compute_compatibility_internal(skb1, skb2)
+
+
+def test_surface_geometry_uses_application_cache():
+    initialize_cache({'backend': 'memory'})
+    first = _surface_geometry(1, (1.0, 1.0, 1.0, 0.0), 0.5, 1.0, 40)
+    second = _surface_geometry(1, (1.0, 1.0, 1.0, 0.0), 0.5, 1.0, 40)
+    assert second[0] is first[0]
+    assert get_cache_stats()['hits'] == 1
+    
+    clear_cache()
+    assert _surface_geometry(1, (1.0, 1.0, 1.0, 0.0), 0.5, 1.0, 40)[0] is not first[0]
+
+
+def test_klein_bottle_cache_is_keyed_by_resolution():
+    initialize_cache({'backend': 'memory'})
+    params = ((1.0, 0.5, 0.2, 0.1), 0.3, 1.0)
+    first = KleinBottleGenerator(resolution=30).generate_parametric_surface(*params)
+    
+    # A separate generator with the same resolution reuses the entry
+    assert KleinBottleGenerator(resolution=30).generate_parametric_surface(*params) is first
+    assert KleinBottleGenerator(resolution=20).generate_parametric_surface(*params)['x'].shape == (20, 20)
+    clear_cache()
+
+
+def test_pickled_klein_bottle_surface_keeps_its_analysis():
+    surface = KleinBottleGenerator(resolution=30).generate_parametric_surface((1.0, 0.5, 0.2, 0.1), 0.3, 1.0)
+    restored = pickle.loads(pickle.dumps(surface))
+    
+    # The analysis travels with the pickle instead of being recomputed
+    assert '_analysis' in vars(restored)
+    assert restored['quality_metrics'] == surface['quality_metrics']
+    np.testing.assert_array_equal(restored['x'], surface['x'])
+
+
+def test_klein_bottle_surface_does_not_keep_derivatives():
+    surface = KleinBottleGenerator(resolution=30).generate_parametric_surface((1.0, 0.5, 0.2, 0.1), 0.3, 1.0)
+    surface['topological_properties']
+    
+    # Reading one analysis fills both, and only small results stay attached
+    assert surface['quality_metrics']['resolution'] == 30
+    assert not any(
+        isinstance(value, np.ndarray) or hasattr(value, 'duu')
+        for value in vars(surface).values()
+    )
+
+
+def test_scattering_cross_section_matrix_matches_pairwise():
+    system = FermionEvolutionSystem()
+    matrix = system.calculate_scattering_cross_section_matrix()
+    
+    assert matrix['fermion_types'] == system.fermion_types
+    for i, fermion1 in enumerate(system.fermion_types):
+        for j, fermion2 in enumerate(system.fermion_types):
+            expected = system.calculate_scattering_cross_section(fermion1, fermion2)
+            for key, value in expected.items():
+                assert np.isclose(matrix[key][i, j], value, rtol=1e-12, atol=0)
+
+
+def test_field_lines_are_styled_per_connection():
+    twists = [[0.1, 0.2, 0.3], [0.2, 0.1, 0.4], [0.15, 0.25, 0.3]]
+    lines = generate_topological_field_lines(twists, 0.7)
+    
+    assert [line['name'] for line in lines] == ['Field Line 1-2', 'Field Line 1-3', 'Field Line 2-3']
+    for line in lines:
+        assert len(line['x']) == len(line['y']) == len(line['z'])
+        assert line['line']['width'] >= 2
+        assert line['line']['color'].startswith('rgba(255, 200, 100, ')
+
+
+def test_jsonify_sends_nan_in_array_views_as_null():
+    values = np.array([[0.5, np.nan], [1.5, 2.0]], dtype=np.float32)
+    
+    with app.app_context():
+        payload = jsonify(column=values[:, 1], grid=np.broadcast_to(values[0], (2, 2)), count=np.int64(3)).get_json()
+    
+    assert payload['column'] == [None, 2.0]
+    assert payload['grid'] == [[0.5, None], [0.5, None]]
+    assert payload['count'] == 3
+
+
+def test_numpy_json_default_converts_numpy_values():
+    assert NumpyJSONProvider.default(np.array([1.0, np.nan])) == [1.0, None]
+    assert NumpyJSONProvider.default(np.array([1, 2])) == [1, 2]
+    assert NumpyJSONProvider.default(np.float32(0.5)) == 0.5
+    with pytest.raises(TypeError):
+        NumpyJSONProvider.default(object())
+
+
+def test_shared_trace_styling_is_read_only_and_serializable():
+    x = np.zeros((4, 4))
+    trace = create_enhanced_surface_trace(x, x, x, x, x, name='Surface', color=(255, 107, 157), opacity=0.8)
+    
+    with pytest.raises(TypeError):
+        trace['lighting']['ambient'] = 1.0
+    with pytest.raises(TypeError):
+        trace['contours']['x']['width'] = 5
+    with app.app_context():
+        payload = jsonify(trace).get_json()
+    assert payload['contours']['x']['width'] == 2
+    assert payload['lighting']['ambient'] == 0.4
+
+
+def test_surface_type_lighting_is_read_only():
+    lighting = VisualizationService()._get_lighting_for_surface_type('Torus')
+    
+    with pytest.raises(TypeError):
+        lighting['ambient'] = 1.0
+    assert VisualizationService()._get_lighting_for_surface_type('Torus')['ambient'] == 0.55
+
+
+def test_intersection_marker_style_is_read_only():
+    points = {'x': np.zeros(2), 'y': np.zeros(2), 'z': np.zeros(2)}
+    trace = VisualizationService()._create_intersection_trace(points, 1)
+    
+    with pytest.raises(TypeError):
+        trace['marker']['size'] = 8
+    with app.app_context():
+        assert jsonify(trace).get_json()['marker']['line']['width'] == 2
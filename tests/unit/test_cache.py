@@ -0,0 +1,202 @@
+import numpy as np
+
+from src.mathematics.klein_bottle import KleinBottleGenerator, KleinBottleSurface
+from src.utils.cache import backends
+from src.utils.cache.backends import MemoryCache, StripedMemoryCache, TieredCache
+from src.utils.cache.manager import CacheManager
+
+
+class _Settings:
+    def __init__(self, scale):
+        self.scale = scale
+
+
+def test_generate_key_rehashes_mutable_objects():
+    manager = CacheManager(MemoryCache())
+    settings = _Settings(1.0)
+    
+    before = manager.generate_key('surface', settings)
+    settings.scale = 2.0
+    assert manager.generate_key('surface', settings) != before
+
+
+def test_hashable_args_keys_keep_argument_types_apart():
+    manager = CacheManager(MemoryCache())
+    calls = []
+    
+    @manager.cached_computation('scale', hashable_args=True)
+    def scale(value, factor=1):
+        calls.append((value, factor))
+        return repr((value, factor))
+    
+    assert scale(1, factor=1) == '(1, 1)'
+    assert scale(1, factor=1.0) == '(1, 1.0)'
+    assert scale(0.0) == '(0.0, 1)'
+    assert scale(-0.0) == '(-0.0, 1)'
+    assert scale(1, factor=1) == '(1, 1)'
+    assert len(calls) == 4
+
+
+def test_generate_key_hashes_array_contents():
+    manager = CacheManager(MemoryCache())
+    values = np.zeros(1 << 16)
+    
+    before = manager.generate_key('surface', values)
+    assert manager.generate_key('surface', values.copy()) == before
+    values[0] = 1.0
+    assert manager.generate_key('surface', values) != before
+
+
+def test_klein_bottle_surfaces_over_the_size_limit_are_not_stored():
+    generator = KleinBottleGenerator(resolution=30)
+    twists = (1.0, 0.5, 0.2, 0.1)
+    manager = CacheManager(MemoryCache(), max_cached_bytes=4096)
+    
+    @manager.cached_computation('klein')
+    def klein(t):
+        coordinates = generator.parametrics.generate_surface_coordinates(twists, t, 1.0)
+        return KleinBottleSurface(coordinates, twists, {}, generator.topology, generator.quality)
+    
+    result = klein(0.3)
+    assert result.nbytes > manager.max_cached_bytes
+    assert manager.backend.size() == 0
+    # Sizing the surface must not run its lazy analysis
+    assert '_analysis' not in vars(result)
+
+
+def test_tiered_cache_promotion_keeps_remaining_ttl():
+    l1 = MemoryCache(max_size=4, default_ttl=3600)
+    l2 = MemoryCache(max_size=4, default_ttl=3600)
+    cache = TieredCache(l1, l2)
+    l2.set('surface', 'geometry', ttl=5)
+    
+    assert cache.get('surface') == 'geometry'
+    value, remaining = l1.get_with_ttl('surface')
+    assert value == 'geometry'
+    assert 0 < remaining <= 5
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_tinylfu_rejects_keys_colder_than_the_victim():
+    cache = MemoryCache(max_size=2, policy='tinylfu')
+    cache.set('a', 1)
+    cache.set('b', 2)
+    for _ in range(3):
+        cache.get('a')
+        cache.get('b')
+    
+    cache.set('cold', 3)
+    assert cache.get('cold') is None
+    assert cache.size() == 2
+    
+    for _ in range(8):
+        cache.get('hot')
+    cache.set('hot', 4)
+    assert cache.get('hot') == 4
+
+
+def test_memory_cache_expires_entries_in_expiry_order(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(backends.time, 'monotonic', lambda: now[0])
+    cache = MemoryCache(max_size=8, default_ttl=100)
+    cache.set('late', 1, ttl=30)
+    cache.set('early', 2, ttl=10)
+    cache.set('default', 3)
+    # Rewriting a key leaves its old heap entry behind; it must not expire it
+    cache.set('late', 4, ttl=50)
+    
+    now[0] += 20
+    assert cache.get('early') is None
+    assert cache.get('late') == 4
+    
+    now[0] += 40
+    assert cache.cleanup_expired() == 1
+    assert cache.get('late') is None
+    assert cache.get('default') == 3
+
+
+def test_striped_memory_cache_round_trip():
+    cache = StripedMemoryCache(stripes=4, max_size=64)
+    for i in range(32):
+        cache.set(f'key{i}', i)
+    
+    assert all(cache.get(f'key{i}') == i for i in range(32))
+    assert cache.size() == 32
+    cache.clear()
+    assert cache.get('key0') is None
+
+
+def test_serialization_round_trips_arrays_and_json():
+    value = {
+        'x': np.arange(12, dtype=np.float32).reshape(3, 4),
+        'u': np.broadcast_to(np.arange(4.0), (3, 4)),
+        'name': 'Klein'
+    }
+    restored = backends._deserialize(backends._serialize(value))
+    
+    np.testing.assert_array_equal(restored['x'], value['x'])
+    np.testing.assert_array_equal(restored['u'], value['u'])
+    assert restored['x'].dtype == np.float32
+    assert restored['x'].flags.writeable
+    assert restored['name'] == 'Klein'
+    
+    plain = {'hits': 3, 'rate': 0.5, 'keys': ['a', None, True]}
+    payload = backends._serialize(plain)
+    assert payload[:1] == backends._TAG_JSON
+    assert backends._deserialize(payload) == plain
+    
+    # Tuples are not JSON-exact, so they are pickled and keep their type
+    assert backends._deserialize(backends._serialize((1, 2.0))) == (1, 2.0)
+
+
+def test_background_writes_reach_the_backend_after_flush():
+    manager = CacheManager(MemoryCache(), background_writes=True)
+    calls = []
+    
+    @manager.cached_computation('square')
+    def square(value):
+        calls.append(value)
+        return value * value
+    
+    assert square(3) == 9
+    manager.flush_writes()
+    assert square(3) == 9
+    assert calls == [3]
+    assert manager.get_stats()['hits'] == 1
+
+
+def test_tiered_cache_promotes_shared_hits():
+    l1 = MemoryCache(max_size=4)
+    l2 = MemoryCache(max_size=4)
+    cache = TieredCache(l1, l2)
+    l2.set('a', 1)
+    l2.set('b', 2)
+    
+    assert cache.get('a') == 1
+    assert l1.get('a') == 1
+    assert cache.get_many(['a', 'b', 'c']) == [1, 2, None]
+    assert l1.get('b') == 2
+    
+    cache.set('c', 3)
+    assert l1.get('c') == 3 and l2.get('c') == 3
+    cache.delete('c')
+    assert not cache.exists('c')
+
+
+def test_large_payloads_round_trip_through_zstd():
+    value = np.zeros(1 << 16)
+    payload = backends._serialize(value)
+    
+    assert payload[:1] == backends._TAG_ZSTD
+    np.testing.assert_array_equal(backends._deserialize(payload), value)